@@ -2,9 +2,10 @@
 """Backfill all existing daily digest videos to Archive.org and podcast feeds."""
 
 import os
+import re
 import sys
-import gzip
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -14,24 +15,49 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent))
 
 from main import (
-    convert_video_to_podcast_audio,
+    get_audio_codec,
+    prepare_podcast_audio,
     upload_to_archive_org,
     update_podcast_feeds,
+    igzip,
     log,
+    DATA_DIR,
+    read_json_file,
+    write_json_file,
 )
 
 VIDEO_DIR = Path("video")
 ARCHIVE_DIR = Path("docs/archive/2026")
+GZIP_READ_BUFFER = 128 * 1024  # 128 KiB file reads instead of the 8 KiB default
+FACTS_INDEX_FILE = DATA_DIR / "archive_facts_index.json"
 
 
 def get_video_duration(video_path: str) -> int:
     """Get video duration in seconds via ffprobe."""
     result = subprocess.run(
-        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-         '-of', 'csv=p=0', video_path],
-        capture_output=True, text=True, timeout=30
+        ['ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
+         '-of', 'default=nk=1:nw=1', video_path],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=30
     )
-    return int(float(result.stdout.strip()))
+    return int(float(result.stdout))  # float() accepts bytes and surrounding whitespace
+
+
+def prefetch_metadata(paths: list) -> dict:
+    """Probe duration and audio codec for all videos concurrently.
+
+    ffprobe is subprocess-bound, so threads overlap the per-spawn cost.
+    Returns {path: (duration, codec)}; duration is None if it can't be read.
+    """
+    def probe(path):
+        try:
+            duration = get_video_duration(str(path))
+        except Exception as e:
+            print(f"  ffprobe failed for {path}: {e}")
+            duration = None
+        return duration, get_audio_codec(str(path))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return dict(zip(paths, executor.map(probe, paths)))
 
 
 def get_facts_from_archive(date: str) -> list:
@@ -45,7 +71,10 @@ def get_facts_from_archive(date: str) -> list:
         return []
     try:
         facts = []
-        with gzip.open(gz_path, 'rt') as f:
+        # The gzip reader pulls small chunks from its file object, so the
+        # large buffer goes on the raw file underneath it
+        with open(gz_path, 'rb', buffering=GZIP_READ_BUFFER) as raw, \
+                igzip.open(raw, 'rt', encoding='utf-8') as f:
             for line in f:
                 line = line.strip()
                 if not line or line.startswith('#'):
@@ -58,6 +87,92 @@ def get_facts_from_archive(date: str) -> list:
         return []
 
 
+def load_facts_index(dates: list) -> dict:
+    """Facts for each date, served from an on-disk index of the archives.
+
+    The index maps date -> {"mtime_ns", "facts"}. An entry is rebuilt from
+    the .txt.gz only when the archive is new or its mtime changed, so repeat
+    backfills skip gzip entirely. Returns {date: facts}.
+    """
+    try:
+        index = read_json_file(FACTS_INDEX_FILE)
+    except (FileNotFoundError, ValueError):
+        index = {}
+
+    facts_by_date = {}
+    changed = False
+    for date in dates:
+        try:
+            mtime_ns = (ARCHIVE_DIR / f"{date}.txt.gz").stat().st_mtime_ns
+        except FileNotFoundError:
+            facts_by_date[date] = []
+            continue
+
+        entry = index.get(date)
+        if not entry or entry.get("mtime_ns") != mtime_ns:
+            entry = {"mtime_ns": mtime_ns, "facts": get_facts_from_archive(date)}
+            index[date] = entry
+            changed = True
+        facts_by_date[date] = entry["facts"]
+
+    if changed:
+        try:
+            write_json_file(FACTS_INDEX_FILE, index, indent=False)
+        except OSError as e:
+            print(f"Could not save facts index: {e}")
+
+    return facts_by_date
+
+
+def video_date(video_path: Path) -> str:
+    """Date of a digest video from its filename: 2026-02-15-daily-digest.mp4"""
+    return video_path.stem.replace("-daily-digest", "")
+
+
+def process_one(video_path: Path, duration: int, codec: str, facts: list) -> tuple:
+    """Convert and upload one digest video. Runs in a worker process.
+
+    Returns (date, archive_result, duration, facts, error). The podcast feed
+    is not touched here; the parent appends episodes in date order so
+    episode numbers stay sequential.
+    """
+    date = video_date(video_path)
+    audio_path = None
+
+    print(f"[{date}] Processing {video_path} ({video_path.stat().st_size / 1024 / 1024:.1f} MB)")
+
+    try:
+        if duration is None:
+            return date, None, None, None, "could not read duration"
+
+        print(f"[{date}] Duration: {duration}s, Stories: {len(facts)}")
+        if facts:
+            print(f"[{date}] First fact: {facts[0][:80]}...")
+
+        # Extract podcast audio (AAC stream copy on disk, MP3 in memory)
+        prepared = prepare_podcast_audio(str(video_path), codec)
+        if not prepared:
+            return date, None, duration, facts, "audio conversion"
+        audio_path, audio_data = prepared
+
+        audio_size = (len(audio_data) if audio_data is not None else os.path.getsize(audio_path)) / (1024 * 1024)
+        print(f"[{date}] Audio: {Path(audio_path).name} {audio_size:.2f} MB, uploading to Archive.org...")
+
+        # Upload to Archive.org (skips if already exists)
+        archive_result = upload_to_archive_org(date, audio_path, str(video_path), audio_data=audio_data)
+        print(f"[{date}] Uploaded: {archive_result['item_id']}")
+
+        return date, archive_result, duration, facts, None
+
+    except Exception as e:
+        return date, None, None, None, str(e)
+
+    finally:
+        # Delete temporary audio - Archive.org is the permanent store
+        if audio_path and Path(audio_path).exists():
+            Path(audio_path).unlink()
+
+
 def main():
     # Find all videos sorted chronologically
     videos = sorted(VIDEO_DIR.glob("*-daily-digest.mp4"))
@@ -67,66 +182,41 @@ def main():
     feed_path = Path("docs/podcast.xml")
     if feed_path.exists():
         content = feed_path.read_text()
-        while "<item>" in content:
-            start = content.index("<item>") - 4  # include indent
-            end = content.index("</item>") + len("</item>") + 1  # include newline
-            content = content[:start] + content[end:]
+        # Drop every <item> block (with its indent and newline) in one pass
+        content = re.sub(r'[ \t]*<item>.*?</item>\n?', '', content, flags=re.DOTALL)
         feed_path.write_text(content)
     print("Reset podcast.xml to empty\n")
 
+    metadata = prefetch_metadata(videos)
+    facts_index = load_facts_index([video_date(v) for v in videos])
+
     success = 0
     failed = 0
 
-    for video_path in videos:
-        # Extract date from filename: 2026-02-15-daily-digest.mp4
-        date = video_path.stem.replace("-daily-digest", "")
-        mp3_path = str(video_path).replace(".mp4", ".mp3")
-
-        print(f"{'='*60}")
-        print(f"Processing {date}")
-        print(f"  Video: {video_path} ({video_path.stat().st_size / 1024 / 1024:.1f} MB)")
-
-        try:
-            # Get metadata
-            duration = get_video_duration(str(video_path))
-            facts = get_facts_from_archive(date)
-            story_count = len(facts)
-            print(f"  Duration: {duration}s, Stories: {story_count}")
-            if facts:
-                print(f"  First fact: {facts[0][:80]}...")
-
-            # Convert to MP3
-            print(f"  Converting to MP3...")
-            if not convert_video_to_podcast_audio(str(video_path), mp3_path):
-                print(f"  FAILED: MP3 conversion")
+    # ffmpeg encoding and Archive.org uploads run in parallel; results come
+    # back in video order so feed updates below stay chronological
+    max_workers = max(1, (os.cpu_count() or 2) // 2)
+    print(f"Processing with {max_workers} workers\n")
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for date, archive_result, duration, facts, error in executor.map(
+                process_one, videos,
+                [metadata[v][0] for v in videos],
+                [metadata[v][1] for v in videos],
+                [facts_index[video_date(v)] for v in videos]):
+            if error:
+                print(f"[{date}] FAILED: {error}")
                 failed += 1
                 continue
 
-            mp3_size = os.path.getsize(mp3_path) / (1024 * 1024)
-            print(f"  MP3: {mp3_size:.2f} MB")
-
-            # Upload to Archive.org (skips if already exists)
-            print(f"  Uploading to Archive.org...")
-            archive_result = upload_to_archive_org(date, mp3_path, str(video_path))
-            print(f"  Uploaded: {archive_result['item_id']}")
-
-            # Update feed with full facts
-            update_podcast_feeds(date, archive_result, story_count, duration, facts=facts)
-            print(f"  Feed updated with {story_count} facts")
-
-            # Delete temporary MP3
-            Path(mp3_path).unlink()
-            print(f"  Cleaned up MP3")
-
-            success += 1
-            print(f"  DONE\n")
-
-        except Exception as e:
-            print(f"  FAILED: {e}\n")
-            failed += 1
-            # Clean up MP3 if it exists
-            if Path(mp3_path).exists():
-                Path(mp3_path).unlink()
+            try:
+                # Update feed with full facts
+                update_podcast_feeds(date, archive_result, len(facts), duration, facts=facts)
+                print(f"[{date}] Feed updated with {len(facts)} facts")
+                success += 1
+            except Exception as e:
+                print(f"[{date}] FAILED: feed update: {e}")
+                failed += 1
 
     print(f"{'='*60}")
     print(f"Backfill complete: {success} succeeded, {failed} failed out of {len(videos)}")
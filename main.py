@@ -16,19 +16,25 @@ This script runs continuously:
 
 from __future__ import annotations
 
+import io
 import os
 import sys
 import json
 import time
 import gzip
 import shutil
+import signal
 import hashlib
 import logging
+import threading
 import re
 import xml.etree.ElementTree as ET
 import calendar
+import itertools
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
@@ -40,6 +46,24 @@ import anthropic
 from elevenlabs import ElevenLabs
 from twilio.rest import Client as TwilioClient
 
+# ISA-L inflate is a drop-in for gzip and much faster at reading archives
+try:
+    from isal import igzip
+except ImportError:
+    igzip = gzip
+
+# orjson encodes/decodes JSON several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# lxml parses feeds and HTML several times faster than the stdlib parsers
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 
 # =============================================================================
 # PYTHON 3.8 COMPATIBILITY
@@ -68,7 +92,6 @@ def clean_duplicate_namespaces(file_path):
     ElementTree sometimes adds duplicate xmlns declarations when multiple
     namespaces are used. This post-processes the file to remove duplicates.
     """
-    import re
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
@@ -126,6 +149,49 @@ def retry_with_backoff(max_retries=3, base_delay=1.0, retryable_exceptions=None)
     return decorator
 
 
+# =============================================================================
+# FILE HELPERS
+# =============================================================================
+
+# fdatasync skips the metadata flush fsync does; macOS only has fsync
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+def atomic_write(path: Path, data: bytes):
+    """Replace a file's contents atomically and durably.
+
+    Writes a sibling temp file, syncs its data, then os.replace()s it over
+    path, so readers (and a crash) see either the old file or the new one,
+    never a truncated mix. The temp file is removed if anything fails.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)  # Buffered write loops over short writes
+            f.flush()
+            _datasync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_json_file(path: Path):
+    """Load a JSON file (orjson when installed)."""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def write_json_file(path: Path, obj, indent: bool = True):
+    """Write a JSON file with atomic_write() (orjson when installed)."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        data = json.dumps(obj, indent=2 if indent else None).encode()
+    atomic_write(path, data)
+
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -150,6 +216,20 @@ ARCHIVE_DIR.mkdir(exist_ok=True)
 with open(CONFIG_FILE) as f:
     CONFIG = json.load(f)
 
+# Source lookup tables (CONFIG is not reloaded at runtime;
+# ownership audits write config.json and take effect on restart)
+SOURCES_BY_ID = {s["id"]: s for s in CONFIG["sources"]}
+SOURCES_BY_NAME = {s["name"]: s for s in CONFIG["sources"]}
+SOURCE_IDS_BY_LOWER_NAME = {s["name"].lower(): s["id"] for s in CONFIG["sources"]}
+SOURCE_OWNERS = {s["id"]: s["owner"] for s in CONFIG["sources"]}
+# Holder name sets for the unrelated-sources check, keyed by id like
+# SOURCE_OWNERS; CONFIG itself stays the plain data loaded from config.json
+SOURCE_HOLDER_SETS = {
+    s["id"]: frozenset(h["name"] for h in s.get("institutional_holders", []))
+    for s in CONFIG["sources"]
+}
+MAX_SHARED_HOLDERS = CONFIG["unrelated_rules"]["max_shared_top_holders"]
+
 # Logging - with explicit flush for network mount compatibility
 class FlushingFileHandler(logging.FileHandler):
     """FileHandler that flushes after every write for network mount sync."""
@@ -232,6 +312,69 @@ _cycle_stats = {
     "cycle_start": None
 }
 
+# =============================================================================
+# API CLIENTS
+# =============================================================================
+
+# Created on first use and reused so each client's HTTP connection pool
+# (and TLS session) survives across calls
+_claude_client = None
+_elevenlabs_client = None
+_twilio_client = None
+
+
+def get_claude_client() -> anthropic.Anthropic:
+    """Get the shared Anthropic client."""
+    global _claude_client
+    if _claude_client is None:
+        _claude_client = anthropic.Anthropic()
+    return _claude_client
+
+
+def get_elevenlabs_client() -> ElevenLabs:
+    """Get the shared ElevenLabs client."""
+    global _elevenlabs_client
+    if _elevenlabs_client is None:
+        _elevenlabs_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+    return _elevenlabs_client
+
+
+def get_twilio_client() -> TwilioClient:
+    """Get the shared Twilio client."""
+    global _twilio_client
+    if _twilio_client is None:
+        _twilio_client = TwilioClient(
+            os.getenv("TWILIO_ACCOUNT_SID"),
+            os.getenv("TWILIO_AUTH_TOKEN")
+        )
+    return _twilio_client
+
+
+# =============================================================================
+# BACKGROUND I/O
+# =============================================================================
+
+# Alert SMS and GitHub pushes run here so the headline loop doesn't wait on
+# them; process_cycle drains the pool before the cycle ends
+_io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="io")
+_io_futures = []
+
+
+def run_in_background(func, *args, **kwargs):
+    """Submit a network call to the background I/O pool."""
+    _io_futures.append(_io_pool.submit(func, *args, **kwargs))
+
+
+def drain_background_io():
+    """Wait for all submitted background calls, logging any that raised."""
+    while _io_futures:
+        future = _io_futures.pop(0)
+        try:
+            future.result()
+        except Exception as e:
+            log.error(f"Background task failed: {e}")
+
+
 # =============================================================================
 # RESILIENCE SYSTEM
 # =============================================================================
@@ -291,7 +434,6 @@ def safe_parse_claude_json(text: str, default: dict) -> dict:
 
     # Strategy 2: Extract from markdown code blocks
     try:
-        import re
         code_match = re.search(r'```(?:json)?\s*(\{[^`]+\})\s*```', text, re.DOTALL)
         if code_match:
             return json.loads(code_match.group(1))
@@ -368,7 +510,7 @@ def validate_services() -> bool:
 
     # Test Claude API with minimal call
     try:
-        client = anthropic.Anthropic()
+        client = get_claude_client()
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=10,
@@ -389,7 +531,7 @@ def validate_services() -> bool:
     # Test ElevenLabs if not already degraded
     if "elevenlabs" not in _degraded_services:
         try:
-            eleven_client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+            eleven_client = get_elevenlabs_client()
             # Just verify the key works - don't generate audio
             # The client will raise if key is invalid on first use
             log.info("ElevenLabs API: OK (key present)")
@@ -434,6 +576,10 @@ def check_budget_alert(total_cost: float):
             send_alert(f"API costs at ${total_cost:.2f} ({pct:.0f}% of ${daily_budget:.2f} budget)", "credits_low")
 
 
+# Serializes read-modify-write of the usage file (extraction runs in threads)
+_api_usage_lock = threading.Lock()
+
+
 def log_api_usage(service: str, usage: dict):
     """Log API usage and costs to daily file.
 
@@ -444,17 +590,21 @@ def log_api_usage(service: str, usage: dict):
             - elevenlabs: {"characters": N}
             - twilio: {"sms_count": N}
     """
+    with _api_usage_lock:
+        _log_api_usage(service, usage)
+
+
+def _log_api_usage(service: str, usage: dict):
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     usage_file = DATA_DIR / f"api_usage_{today}.json"
 
     # Load existing usage
     data = {"date": today, "services": {}, "total_cost_usd": 0.0}
-    if usage_file.exists():
-        try:
-            with open(usage_file) as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
+    try:
+        with open(usage_file) as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        pass
 
     # Initialize service if not present
     if service not in data["services"]:
@@ -794,6 +944,11 @@ Headline to process:
 """
 
 
+# Fallback field extraction for malformed JSON replies
+FACT_FIELD_RE = re.compile(r'"fact"\s*:\s*"([^"]*(?:\\.[^"]*)*)"')
+CONFIDENCE_FIELD_RE = re.compile(r'"confidence"\s*:\s*(\d+)')
+
+
 @retry_with_backoff(max_retries=3, base_delay=1.0, retryable_exceptions=(
     ConnectionError, TimeoutError, OSError,
     anthropic.APITimeoutError, anthropic.APIConnectionError,
@@ -814,7 +969,7 @@ def extract_fact(headline: str, use_cache: bool = True) -> dict:
             return cached
 
     try:
-        client = anthropic.Anthropic()
+        client = get_claude_client()
 
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
@@ -845,8 +1000,10 @@ def extract_fact(headline: str, use_cache: bool = True) -> dict:
             pass
 
         # Fallback: Extract fields using regex (handles malformed JSON)
-        fact_match = re.search(r'"fact"\s*:\s*"([^"]*(?:\\.[^"]*)*)"', text)
-        conf_match = re.search(r'"confidence"\s*:\s*(\d+)', text)
+        if '"fact"' not in text:
+            return {"fact": "SKIP", "confidence": 0, "removed": []}
+        fact_match = FACT_FIELD_RE.search(text)
+        conf_match = CONFIDENCE_FIELD_RE.search(text)
 
         if fact_match:
             fact = fact_match.group(1).replace('\\"', '"')
@@ -936,11 +1093,11 @@ def search_judge_info(fact: str, original_headline: str) -> dict | None:
             return None
 
         # Parse search results
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, HTML_PARSER)
         results_text = soup.get_text()[:3000]  # First 3000 chars of results
 
         # Use Claude to extract judge info from search results
-        client = anthropic.Anthropic()
+        client = get_claude_client()
 
         prompt = f"""From these search results, extract the judge's information for this news story.
 
@@ -1028,6 +1185,30 @@ ROBOTS_CACHE_TTL = 3600  # 1 hour
 
 USER_AGENT = "JTFNews/1.0"
 
+# Shared HTTP session so repeat fetches reuse TCP/TLS connections
+http_session = requests.Session()
+
+ATOM_ENTRY = "{http://www.w3.org/2005/Atom}entry"
+HTML_PARSER = "lxml" if lxml_etree is not None else "html.parser"
+
+
+def iter_feed_items(content: bytes):
+    """Stream-parse an RSS/Atom feed, yielding each <item>/<entry> as it completes.
+
+    Lets callers stop after the first few items without building the whole tree.
+    """
+    if lxml_etree is not None:
+        parser = lxml_etree.iterparse(io.BytesIO(content), events=("end",),
+                                      tag=("item", ATOM_ENTRY), resolve_entities=False)
+        for _, elem in parser:
+            yield elem
+            elem.clear()
+    else:
+        for _, elem in ET.iterparse(io.BytesIO(content), events=("end",)):
+            if elem.tag in ("item", ATOM_ENTRY):
+                yield elem
+                elem.clear()
+
 
 def can_fetch_url(url: str) -> bool:
     """Check if we're allowed to fetch this URL per robots.txt."""
@@ -1085,16 +1266,11 @@ def fetch_rss_headlines(source: dict) -> list:
             "User-Agent": f"{USER_AGENT} (Facts only, no opinions; RSS reader)"
         }
 
-        response = requests.get(rss_url, headers=headers, timeout=15)
+        response = http_session.get(rss_url, headers=headers, timeout=15)
         response.raise_for_status()
 
-        # Parse RSS XML
-        root = ET.fromstring(response.content)
-
         # RSS feeds have items under channel, Atom feeds have entry elements
-        items = root.findall('.//item') or root.findall('.//{http://www.w3.org/2005/Atom}entry')
-
-        for item in items[:10]:  # Limit to first 10 headlines
+        for item in itertools.islice(iter_feed_items(response.content), 10):  # Limit to first 10 headlines
             # Try RSS format first, then Atom format
             title = item.find('title')
             if title is None:
@@ -1142,10 +1318,10 @@ def fetch_html_headlines(source: dict) -> list:
             "Connection": "keep-alive",
         }
 
-        response = requests.get(source["url"], headers=headers, timeout=15, allow_redirects=True)
+        response = http_session.get(source["url"], headers=headers, timeout=15, allow_redirects=True)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, HTML_PARSER)
 
         # Find headlines using configured selector
         elements = soup.select(source["scrape_selector"])
@@ -1184,16 +1360,83 @@ def fetch_headlines(source: dict) -> list:
     return headlines
 
 
-def scrape_all_sources() -> list:
-    """Scrape headlines from all configured sources."""
-    all_headlines = []
+def fetch_source_group(sources: list, processed_cache: set) -> dict:
+    """Fetch sources that share a host one at a time.
+
+    Headlines already sent to Claude today are dropped here, in the fetch
+    thread, so they never reach the main loop. Returns
+    {source_id: ([(headline_hash, headline), ...], skipped_count)}.
+    """
+    results = {}
+    for i, source in enumerate(sources):
+        if i:
+            time.sleep(1)  # Be polite between requests to the same host
+        new_headlines = []
+        skipped = 0
+        for headline in fetch_headlines(source):
+            headline_hash = get_story_hash(headline["text"])
+            if headline_hash in processed_cache:
+                skipped += 1
+            else:
+                new_headlines.append((headline_hash, headline))
+        results[source["id"]] = (new_headlines, skipped)
+    return results
+
+
+# Concurrent Claude calls for fact extraction (kept low for API rate limits)
+EXTRACTION_WORKERS = 5
+
+
+def scrape_and_extract(processed_cache: set) -> tuple:
+    """Scrape all configured sources, starting fact extraction as hosts finish.
+
+    Sources on different hosts are fetched concurrently; sources sharing a
+    host are fetched serially with a delay between them. Headlines processed
+    on earlier cycles are dropped in the fetch threads; as soon as a host's
+    remaining headlines arrive they are handed to the extraction pool, so
+    Claude calls overlap the fetches still in flight. Headlines are marked
+    processed by the caller once their result is used.
+
+    Returns (pending, total, skipped): pending is a list of
+    (headline_hash, headline, future) in config order, where
+    future.result() is the extract_fact() result.
+    """
+    groups = {}
+    for source in CONFIG["sources"]:
+        groups.setdefault(urlparse(source["url"]).netloc, []).append(source)
 
+    extractor = ThreadPoolExecutor(max_workers=EXTRACTION_WORKERS)
+    submitted = {}  # source_id -> [(headline_hash, headline, extraction future)]
+    seen = set()  # Headline hashes submitted this cycle
+    total = skipped = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, len(groups))) as scraper:
+            fetches = [scraper.submit(fetch_source_group, group, processed_cache)
+                       for group in groups.values()]
+            for fetch in as_completed(fetches):
+                for source_id, (headlines, source_skipped) in fetch.result().items():
+                    total += len(headlines) + source_skipped
+                    skipped += source_skipped
+                    entries = []
+                    for headline_hash, headline in headlines:
+                        # Same headline from another source earlier this cycle
+                        if headline_hash in seen or headline_hash in processed_cache:
+                            skipped += 1
+                            continue
+                        seen.add(headline_hash)
+                        entries.append((headline_hash, headline,
+                                        extractor.submit(extract_fact, headline["text"])))
+                    submitted[source_id] = entries
+    finally:
+        # Queued extractions keep running; the caller collects them in order
+        extractor.shutdown(wait=False)
+
+    # Keep config order so processing order doesn't depend on fetch timing
+    pending = []
     for source in CONFIG["sources"]:
-        headlines = fetch_headlines(source)
-        all_headlines.extend(headlines)
-        time.sleep(1)  # Be polite between requests
+        pending.extend(submitted.get(source["id"], []))
 
-    return all_headlines
+    return pending, total, skipped
 
 
 # =============================================================================
@@ -1201,8 +1444,13 @@ def scrape_all_sources() -> list:
 # =============================================================================
 
 def get_story_hash(text: str) -> str:
-    """Generate hash of story text for deduplication."""
-    return hashlib.md5(text.lower().encode()).hexdigest()[:12]
+    """Generate hash of story text for deduplication.
+
+    12 hex chars (48-bit BLAKE2b). Replaced truncated MD5; older day files
+    may still hold MD5 entries, which simply never match and expire at the
+    midnight cleanup.
+    """
+    return hashlib.blake2b(text.lower().encode(), digest_size=6).hexdigest()
 
 
 def get_ordinal_suffix(n: int) -> str:
@@ -1223,134 +1471,122 @@ def get_ordinal_suffix(n: int) -> str:
 
 def are_sources_unrelated(source1_id: str, source2_id: str) -> bool:
     """Check if two sources are unrelated (different owners)."""
-    sources = {s["id"]: s for s in CONFIG["sources"]}
-
-    s1 = sources.get(source1_id)
-    s2 = sources.get(source2_id)
-
-    if not s1 or not s2:
+    if source1_id not in SOURCE_OWNERS or source2_id not in SOURCE_OWNERS:
         return False
 
     # Same owner = related
-    if s1["owner"] == s2["owner"]:
+    if SOURCE_OWNERS[source1_id] == SOURCE_OWNERS[source2_id]:
         return False
 
     # Check institutional holder overlap
-    holders1 = {h["name"] for h in s1.get("institutional_holders", [])}
-    holders2 = {h["name"] for h in s2.get("institutional_holders", [])}
+    shared = SOURCE_HOLDER_SETS[source1_id] & SOURCE_HOLDER_SETS[source2_id]
+    return len(shared) < MAX_SHARED_HOLDERS
 
-    shared = holders1 & holders2
-    if len(shared) >= CONFIG["unrelated_rules"]["max_shared_top_holders"]:
-        return False
 
-    return True
+@lru_cache(maxsize=4096)
+def get_fact_tokens(text: str) -> frozenset:
+    """Meaningful words (3+ chars, lowercase) of a fact, memoized.
 
+    Queue and published facts are compared against every new fact, so
+    caching by text avoids re-splitting them on each comparison.
+    """
+    return frozenset(w.lower() for w in text.split() if len(w) >= 3)
 
-def has_word_overlap(fact1: str, fact2: str, threshold: float = 0.15) -> bool:
-    """Quick check if two facts share enough words to possibly be related.
 
-    Returns True if at least threshold% of words overlap.
-    This is a cheap pre-filter before calling Claude.
-    """
-    # Extract meaningful words (3+ chars, lowercase)
-    words1 = set(w.lower() for w in fact1.split() if len(w) >= 3)
-    words2 = set(w.lower() for w in fact2.split() if len(w) >= 3)
+def has_word_overlap_tokens(tokens1: frozenset, tokens2: frozenset, threshold: float = 0.15) -> bool:
+    """Quick check if two token sets share enough words to possibly be related.
 
-    if not words1 or not words2:
+    True if at least threshold of the smaller set's words are shared. A cheap
+    pre-filter before calling Claude; find_overlapping_facts() applies it
+    through an inverted index.
+    """
+    if not tokens1 or not tokens2:
         return False
 
-    shared = words1 & words2
-    min_len = min(len(words1), len(words2))
+    shared = tokens1 & tokens2
+    min_len = min(len(tokens1), len(tokens2))
 
     return len(shared) >= min_len * threshold
 
 
-def find_matching_stories(fact: str, queue: list) -> list:
-    """Find stories in queue that match this fact (same core event).
+# Inverted indexes over the fact lists every new fact is checked against:
+# name -> (indexed facts, token -> positions). Extended as a list grows and
+# rebuilt when it changes otherwise (queue removals/expiry, midnight reset)
+_overlap_indexes: dict = {}
 
-    Pre-filters with word overlap, then uses single Claude call for candidates.
-    """
-    if not queue:
-        return []
 
-    # Pre-filter: only check items with some word overlap (saves API calls)
-    candidates = [item for item in queue if has_word_overlap(fact, item["fact"])]
+def find_overlapping_facts(name: str, fact_tokens: frozenset, facts: list,
+                           threshold: float = 0.15) -> list:
+    """Positions in facts that pass the word overlap pre-filter for a new fact.
 
-    if not candidates:
+    Same result as testing each fact with has_word_overlap_tokens(), but
+    shared words are counted through the inverted index kept for name
+    ("published" or "queue"), so facts with no word in common are never visited.
+    """
+    indexed, postings = _overlap_indexes.get(name, ([], {}))
+    count = len(indexed)
+    if len(facts) < count or facts[:count] != indexed:
+        indexed, postings, count = [], {}, 0
+    for i in range(count, len(facts)):
+        for token in get_fact_tokens(facts[i]):
+            postings.setdefault(token, []).append(i)
+    indexed.extend(facts[count:])
+    _overlap_indexes[name] = (indexed, postings)
+
+    if not fact_tokens:
         return []
 
-    log.info(f"Word overlap pre-filter: {len(candidates)}/{len(queue)} candidates")
-
-    try:
-        client = anthropic.Anthropic()
-
-        # Build numbered list of candidate facts
-        queue_list = "\n".join([f"{i+1}. {item['fact']}" for i, item in enumerate(candidates)])
-
-        prompt = f"""Compare this new fact against the numbered list below.
-Return ONLY the numbers of facts that describe the SAME EVENT as the new fact.
-Same event means: same incident, same person doing same action, same announcement.
-Details like death counts or exact wording may differ.
-
-New fact: {fact}
-
-Existing facts:
-{queue_list}
-
-Reply with ONLY comma-separated numbers (e.g., "1,3,5") or "NONE" if no matches."""
-
-        response = client.messages.create(
-            model=CONFIG["claude"]["model"],
-            max_tokens=50,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        # Log API usage for cost tracking
-        log_api_usage("claude", {
-            "input_tokens": response.usage.input_tokens,
-            "output_tokens": response.usage.output_tokens
-        })
+    shared = Counter()
+    for token in fact_tokens:
+        shared.update(postings.get(token, ()))
 
-        answer = response.content[0].text.strip().upper()
+    return [i for i, n in sorted(shared.items())
+            if n >= min(len(fact_tokens), len(get_fact_tokens(facts[i]))) * threshold]
 
-        if answer == "NONE" or not answer:
-            return []
 
-        # Parse the numbers (referencing candidates list)
-        matches = []
-        for num_str in answer.replace(" ", "").split(","):
-            try:
-                idx = int(num_str) - 1  # Convert to 0-indexed
-                if 0 <= idx < len(candidates):
-                    matches.append(candidates[idx])
-            except ValueError:
-                continue
-
-        return matches
+def parse_fact_numbers(values, candidates: list) -> list:
+    """Map 1-based numbers from a Claude reply onto the candidate list."""
+    picked = []
+    for value in values if isinstance(values, list) else []:
+        try:
+            idx = int(value) - 1  # Convert to 0-indexed
+        except (TypeError, ValueError):
+            continue
+        if 0 <= idx < len(candidates) and candidates[idx] not in picked:
+            picked.append(candidates[idx])
+    return picked
 
-    except Exception as e:
-        log.error(f"Claude batch matching error: {e}")
-        return []
 
+def check_duplicate_and_matches(fact: str, queue: list, published: list) -> tuple:
+    """Check a new fact against today's published stories and the queue.
 
-def is_duplicate_batch(fact: str, published: list) -> bool:
-    """Check if fact matches any published story using a single Claude call."""
-    if not published:
-        return False
+    Returns (is_duplicate, matches): whether the fact repeats an already
+    published story, and the queue items describing the same event.
+    Pre-filters both lists with word overlap, then answers both questions
+    with a single Claude call.
+    """
+    # Pre-filter: only check items with some word overlap (saves API calls)
+    fact_tokens = get_fact_tokens(fact)
+    pub_candidates = [published[i] for i in
+                      find_overlapping_facts("published", fact_tokens, published)]
+    queue_candidates = [queue[i] for i in
+                        find_overlapping_facts("queue", fact_tokens, [item["fact"] for item in queue])]
 
-    # Pre-filter: only check stories with word overlap
-    candidates = [p for p in published if has_word_overlap(fact, p)]
+    if not pub_candidates and not queue_candidates:
+        return False, []  # No overlap = not a duplicate and no match
 
-    if not candidates:
-        return False  # No overlap = definitely not a duplicate
+    log.info(f"Word overlap pre-filter: {len(pub_candidates)}/{len(published)} published, "
+             f"{len(queue_candidates)}/{len(queue)} queued candidates")
 
     try:
-        client = anthropic.Anthropic()
+        client = get_claude_client()
 
-        # Build numbered list of candidate published facts
-        pub_list = "\n".join([f"{i+1}. {p}" for i, p in enumerate(candidates)])
+        # Build numbered lists of candidate facts
+        pub_list = "\n".join([f"{i+1}. {p}" for i, p in enumerate(pub_candidates)]) or "(none)"
+        queue_list = "\n".join([f"{i+1}. {item['fact']}" for i, item in enumerate(queue_candidates)]) or "(none)"
 
-        prompt = f"""Does this new fact describe the SAME EVENT as any fact in the list below?
+        prompt = f"""Compare this new fact against the two numbered lists below.
+Find the facts that describe the SAME EVENT as the new fact.
 Same event means: same incident, same person doing same action, same announcement.
 Details like death counts or exact wording may differ.
 
@@ -1359,11 +1595,16 @@ New fact: {fact}
 Published facts:
 {pub_list}
 
-Reply with ONLY "YES" or "NO"."""
+Queued facts:
+{queue_list}
+
+Reply with ONLY a JSON object listing the matching numbers from each list:
+{{"published": [numbers], "queued": [numbers]}}
+Use empty lists when nothing matches."""
 
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
-            max_tokens=10,
+            max_tokens=100,
             messages=[{"role": "user", "content": prompt}]
         )
 
@@ -1373,15 +1614,17 @@ Reply with ONLY "YES" or "NO"."""
             "output_tokens": response.usage.output_tokens
         })
 
-        answer = response.content[0].text.strip().upper()
-        if answer == "YES":
+        result = safe_parse_claude_json(response.content[0].text, {"published": [], "queued": []})
+
+        if parse_fact_numbers(result.get("published"), pub_candidates):
             log.info(f"Duplicate (Claude batch): '{fact[:40]}...'")
-            return True
-        return False
+            return True, []
+
+        return False, parse_fact_numbers(result.get("queued"), queue_candidates)
 
     except Exception as e:
-        log.error(f"Claude duplicate check error: {e}")
-        return False
+        log.error(f"Claude duplicate/matching error: {e}")
+        return False, []
 
 
 # =============================================================================
@@ -1391,10 +1634,11 @@ Reply with ONLY "YES" or "NO"."""
 def load_learned_ratings() -> dict:
     """Load learned ratings from file. Returns dict of source_id -> stats."""
     ratings_file = DATA_DIR / "learned_ratings.json"
-    if ratings_file.exists():
+    try:
         with open(ratings_file) as f:
             return json.load(f)
-    return {}
+    except FileNotFoundError:
+        return {}
 
 
 def save_learned_ratings(ratings: dict):
@@ -1466,9 +1710,9 @@ def get_learned_rating(source_id: str) -> float:
 
     if source_id not in ratings:
         # Return default from config
-        for source in CONFIG["sources"]:
-            if source["id"] == source_id:
-                return source["ratings"]["accuracy"]
+        source = SOURCES_BY_ID.get(source_id)
+        if source:
+            return source["ratings"]["accuracy"]
         return 5.0  # Fallback
 
     stats = ratings[source_id]
@@ -1476,13 +1720,13 @@ def get_learned_rating(source_id: str) -> float:
 
     if total < 5:
         # Not enough data yet, blend with default
-        for source in CONFIG["sources"]:
-            if source["id"] == source_id:
-                default = source["ratings"]["accuracy"]
-                learned = (stats["successes"] / total) * 10 if total > 0 else default
-                # Weight: more data = more weight on learned rating
-                weight = total / 5
-                return default * (1 - weight) + learned * weight
+        source = SOURCES_BY_ID.get(source_id)
+        if source:
+            default = source["ratings"]["accuracy"]
+            learned = (stats["successes"] / total) * 10 if total > 0 else default
+            # Weight: more data = more weight on learned rating
+            weight = total / 5
+            return default * (1 - weight) + learned * weight
         return 5.0
 
     # Enough data, use learned rating
@@ -1518,10 +1762,9 @@ def get_display_rating(source_id: str) -> str:
 
     # Get default rating from config
     default_rating = 5.0
-    for source in CONFIG["sources"]:
-        if source["id"] == source_id:
-            default_rating = source["ratings"]["accuracy"]
-            break
+    source = SOURCES_BY_ID.get(source_id)
+    if source:
+        default_rating = source["ratings"]["accuracy"]
 
     if source_id not in ratings:
         # No data - show default with asterisk
@@ -1565,10 +1808,9 @@ def get_compact_scores(source_id: str) -> str:
     # Config stores bias on -2 to +2 scale (political leaning)
     # Convert to 0-10 scale where 10 = neutral, 0 = heavily biased
     raw_bias = 0.0
-    for source in CONFIG["sources"]:
-        if source["id"] == source_id:
-            raw_bias = source["ratings"].get("bias", 0.0)
-            break
+    source = SOURCES_BY_ID.get(source_id)
+    if source:
+        raw_bias = source["ratings"].get("bias", 0.0)
 
     # Convert: 0 → 10, ±2 → 0
     # Formula: 10 - (abs(bias) * 5), clamped to 0-10
@@ -1579,11 +1821,7 @@ def get_compact_scores(source_id: str) -> str:
 
 def get_source_id_by_name(source_name: str) -> str:
     """Look up source ID from source name. Returns empty string if not found."""
-    name_lower = source_name.lower().strip()
-    for source in CONFIG["sources"]:
-        if source["name"].lower() == name_lower:
-            return source["id"]
-    return ""
+    return SOURCE_IDS_BY_LOWER_NAME.get(source_name.lower().strip(), "")
 
 
 def get_source_for_rss(source_id: str) -> dict:
@@ -1594,11 +1832,7 @@ def get_source_for_rss(source_id: str) -> dict:
     owners as nested elements with name and percent.
     """
     # Find source in config
-    source_config = None
-    for source in CONFIG["sources"]:
-        if source["id"] == source_id:
-            source_config = source
-            break
+    source_config = SOURCES_BY_ID.get(source_id)
 
     if not source_config:
         return {"name": source_id, "url": "", "accuracy": "0.0", "bias": "0.0",
@@ -1651,16 +1885,18 @@ def load_queue() -> list:
     """Load the story queue from file."""
     queue_file = DATA_DIR / "queue.json"
     if queue_file.exists():
-        with open(queue_file) as f:
-            return json.load(f)
+        return read_json_file(queue_file)
     return []
 
 
 def save_queue(queue: list):
     """Save the story queue to file."""
-    queue_file = DATA_DIR / "queue.json"
-    with open(queue_file, 'w') as f:
-        json.dump(queue, f, indent=2)
+    write_json_file(DATA_DIR / "queue.json", queue)
+
+
+def queue_items(queue: dict) -> list:
+    """Flatten the in-cycle queue (fact -> entries) back to a list of entries."""
+    return [item for items in queue.values() for item in items]
 
 
 def clean_expired_queue(queue: list) -> list:
@@ -1686,56 +1922,107 @@ def clean_expired_queue(queue: list) -> list:
 # DUPLICATE DETECTION
 # =============================================================================
 
-def load_shown_hashes() -> set:
-    """Load hashes of stories shown today."""
+# Per-day hash files ({kind}_YYYY-MM-DD.txt) are read once per day and kept
+# in memory; appends go through a handle that stays open until the date changes
+_day_hash_sets = {}  # kind -> (date, set of hashes)
+_day_hash_files = {}  # kind -> (date, open append handle)
+
+
+def load_day_hashes(kind: str) -> set:
+    """Get today's hashes for kind ("shown" or "processed").
+
+    The returned set is live: add_day_hash() updates it in place.
+    """
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    cached = _day_hash_sets.get(kind)
+
+    if cached is None or cached[0] != today:
+        hash_file = DATA_DIR / f"{kind}_{today}.txt"
+        try:
+            with open(hash_file) as f:
+                hashes = set(line.strip() for line in f if line.strip())
+        except FileNotFoundError:
+            hashes = set()
+        cached = (today, hashes)
+        _day_hash_sets[kind] = cached
+
+    return cached[1]
+
+
+def add_day_hash(kind: str, value: str):
+    """Record a hash in today's file and in-memory set for kind."""
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    hash_file = DATA_DIR / f"shown_{today}.txt"
+    hashes = load_day_hashes(kind)
+
+    handle = _day_hash_files.get(kind)
+    if handle is None or handle[0] != today:
+        if handle is not None:
+            handle[1].close()
+        # Line-buffered: one write() per hash, no reopen per call
+        handle = (today, open(DATA_DIR / f"{kind}_{today}.txt", 'a', buffering=1))
+        _day_hash_files[kind] = handle
 
-    if hash_file.exists():
-        with open(hash_file) as f:
-            return set(line.strip() for line in f if line.strip())
-    return set()
+    handle[1].write(value + '\n')
+    hashes.add(value)
+
+
+def load_shown_hashes() -> set:
+    """Load hashes of stories shown today."""
+    return load_day_hashes("shown")
 
 
 def add_shown_hash(story_hash: str):
     """Add a hash to today's shown list."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    hash_file = DATA_DIR / f"shown_{today}.txt"
+    add_day_hash("shown", story_hash)
+
+
+# Parsed stories.json: (mtime_ns, size, data). While _stories_dirty is set the
+# in-memory data holds publications not yet written by flush_stories_json()
+_stories_read_cache = None
+_stories_dirty = False
+
+
+def load_stories_data() -> dict | None:
+    """Load stories.json, re-parsing only when the file has changed on disk.
+
+    The returned dict is shared; only update_stories_json() modifies it.
+    """
+    global _stories_read_cache
+    stories_file = DATA_DIR / "stories.json"
+
+    if _stories_dirty:
+        return _stories_read_cache[2]
+
+    try:
+        st = stories_file.stat()
+    except FileNotFoundError:
+        return None
 
-    with open(hash_file, 'a') as f:
-        f.write(story_hash + '\n')
+    key = (st.st_mtime_ns, st.st_size)
+    if _stories_read_cache is None or _stories_read_cache[:2] != key:
+        _stories_read_cache = (*key, read_json_file(stories_file))
+    return _stories_read_cache[2]
 
 
 def load_published_stories() -> list:
     """Load today's published stories from stories.json."""
-    stories_file = DATA_DIR / "stories.json"
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-    if stories_file.exists():
-        try:
-            with open(stories_file) as f:
-                data = json.load(f)
-            if data.get("date") == today:
-                return [s["fact"] for s in data.get("stories", [])]
-        except:
-            pass
+    try:
+        data = load_stories_data()
+        if data and data.get("date") == today:
+            return [s["fact"] for s in data.get("stories", [])]
+    except:
+        pass
     return []
 
 
 def is_duplicate(fact: str) -> bool:
-    """Check if this fact matches any story already published today.
+    """Check if this exact fact was already published today (hash match).
 
-    Uses fast hash check first, then single Claude call for semantic matching.
+    Semantic duplicates are caught by check_duplicate_and_matches().
     """
-    # Fast path: exact text match via hash
-    story_hash = get_story_hash(fact)
-    shown = load_shown_hashes()
-    if story_hash in shown:
-        return True
-
-    # Semantic check: single Claude call to check against all published stories
-    published = load_published_stories()
-    return is_duplicate_batch(fact, published)
+    return get_story_hash(fact) in load_shown_hashes()
 
 
 # =============================================================================
@@ -1744,28 +2031,12 @@ def is_duplicate(fact: str) -> bool:
 
 def load_processed_headlines() -> set:
     """Load hashes of headlines already sent to Claude today."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    cache_file = DATA_DIR / f"processed_{today}.txt"
-
-    if cache_file.exists():
-        with open(cache_file) as f:
-            return set(line.strip() for line in f if line.strip())
-    return set()
+    return load_day_hashes("processed")
 
 
 def add_processed_headline(headline_hash: str):
     """Mark a headline as processed."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    cache_file = DATA_DIR / f"processed_{today}.txt"
-
-    with open(cache_file, 'a') as f:
-        f.write(headline_hash + '\n')
-
-
-def is_headline_processed(headline_text: str, processed_cache: set) -> bool:
-    """Check if we've already sent this headline to Claude."""
-    headline_hash = get_story_hash(headline_text)
-    return headline_hash in processed_cache
+    add_day_hash("processed", headline_hash)
 
 
 # =============================================================================
@@ -1774,6 +2045,7 @@ def is_headline_processed(headline_text: str, processed_cache: set) -> bool:
 
 # In-memory cache for fact extractions (headline_hash -> extraction result)
 _fact_extraction_cache: dict = {}
+_fact_cache_lock = threading.Lock()
 
 
 def load_fact_extraction_cache() -> dict:
@@ -1781,13 +2053,11 @@ def load_fact_extraction_cache() -> dict:
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     cache_file = DATA_DIR / f"fact_cache_{today}.json"
 
-    if cache_file.exists():
-        try:
-            with open(cache_file) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+    try:
+        with open(cache_file) as f:
+            return json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return {}
 
 
 def save_fact_extraction(headline_hash: str, result: dict):
@@ -1796,13 +2066,13 @@ def save_fact_extraction(headline_hash: str, result: dict):
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     cache_file = DATA_DIR / f"fact_cache_{today}.json"
 
-    _fact_extraction_cache[headline_hash] = result
-
-    try:
-        with open(cache_file, 'w') as f:
-            json.dump(_fact_extraction_cache, f)
-    except IOError as e:
-        log.warning(f"Could not save fact cache: {e}")
+    with _fact_cache_lock:
+        _fact_extraction_cache[headline_hash] = result
+        try:
+            with open(cache_file, 'w') as f:
+                json.dump(_fact_extraction_cache, f)
+        except IOError as e:
+            log.warning(f"Could not save fact cache: {e}")
 
 
 def get_cached_fact_extraction(headline_text: str) -> dict | None:
@@ -1820,17 +2090,14 @@ def get_next_audio_index() -> int:
 
     DEPRECATED: Use get_story_audio_id() for new code.
     """
-    stories_file = DATA_DIR / "stories.json"
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-    if stories_file.exists():
-        try:
-            with open(stories_file) as f:
-                stories = json.load(f)
-            if stories.get("date") == today:
-                return len(stories.get("stories", []))
-        except:
-            pass
+    try:
+        stories = load_stories_data()
+        if stories and stories.get("date") == today:
+            return len(stories.get("stories", []))
+    except:
+        pass
     return 0
 
 
@@ -1845,8 +2112,11 @@ def get_story_audio_id(fact: str) -> str:
 
     Returns:
         Audio ID like 'a3f2b1c9d4e5' (12 chars)
+
+    Stays on truncated MD5 rather than get_story_hash(): audio files are
+    archived per date and looked up by this name for as long as they exist.
     """
-    return get_story_hash(fact)
+    return hashlib.md5(fact.lower().encode()).hexdigest()[:12]
 
 
 @retry_with_backoff(max_retries=2, base_delay=1.0)
@@ -1866,7 +2136,7 @@ def generate_tts(text: str, audio_index: int = None, story_id: str = None, archi
         Audio filename on success, False on failure
     """
     try:
-        client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+        client = get_elevenlabs_client()
 
         # Generate audio using the new client API
         audio_generator = client.text_to_speech.convert(
@@ -2008,11 +2278,8 @@ def format_source_names_with_ratings(source_names_str: str) -> str:
 
     for name in names[:2]:  # Only show first 2
         # Look up source ID by name
-        source_id = None
-        for src in CONFIG["sources"]:
-            if src["name"] == name:
-                source_id = src["id"]
-                break
+        src = SOURCES_BY_NAME.get(name)
+        source_id = src["id"] if src else None
 
         if source_id:
             formatted_parts.append(f"{name} {get_compact_scores(source_id)}")
@@ -2050,27 +2317,58 @@ def format_source_attribution(sources: list) -> str:
     return source_text
 
 
-def write_current_story(fact: str, sources: list):
-    """Write the current story to output files."""
-    # Format source attribution with evidence-based ratings
-    source_text = format_source_attribution(sources)
+def write_current_story(fact: str, source_text: str):
+    """Write the current story to output files.
 
-    # Write current story
-    with open(DATA_DIR / "current.txt", 'w') as f:
-        f.write(fact)
-
-    # Write source attribution
-    with open(DATA_DIR / "source.txt", 'w') as f:
-        f.write(source_text)
+    source_text is the format_source_attribution() string for the story.
+    """
+    # Write current story and source attribution
+    atomic_write(DATA_DIR / "current.txt", fact.encode("utf-8"))
+    atomic_write(DATA_DIR / "source.txt", source_text.encode("utf-8"))
 
     log.info(f"Published: {fact[:50]}...")
 
 
-def append_daily_log(fact: str, sources: list, audio_file: str = None):
-    """Append story to daily log."""
+# Today's daily log, held open between publications: (date, file).
+# Lines are buffered; flush_daily_log() runs at cycle end and before reads.
+_daily_log_handle = None
+
+# Format: timestamp|names|scores|urls|audio|fact (6 fields)
+DAILY_LOG_LINE = "%s|%s|%s|%s|%s|%s\n"
+
+
+def get_daily_log_file():
+    """Return today's daily log open for appending, rotating at UTC midnight."""
+    global _daily_log_handle
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    log_file = DATA_DIR / f"{today}.txt"
 
+    if _daily_log_handle is None or _daily_log_handle[0] != today:
+        close_daily_log()
+        f = open(DATA_DIR / f"{today}.txt", 'a', buffering=64 * 1024)
+        # Create header if new file
+        if f.tell() == 0:
+            f.write(f"# JTF News Daily Log\n# Date: {today}\n# Generated: UTC\n\n")
+        _daily_log_handle = (today, f)
+
+    return _daily_log_handle[1]
+
+
+def flush_daily_log():
+    """Write buffered daily log lines to disk."""
+    if _daily_log_handle is not None:
+        _daily_log_handle[1].flush()
+
+
+def close_daily_log():
+    """Flush and close the daily log handle (before archiving or rewriting it)."""
+    global _daily_log_handle
+    if _daily_log_handle is not None:
+        _daily_log_handle[1].close()
+        _daily_log_handle = None
+
+
+def append_daily_log(fact: str, sources: list, source_text: str, audio_file: str = None):
+    """Append story to daily log (source_text: see write_current_story)."""
     timestamp = datetime.now(timezone.utc).isoformat()
     source_names = ",".join([s["source_name"] for s in sources[:2]])
     if len(sources) > 2:
@@ -2079,25 +2377,33 @@ def append_daily_log(fact: str, sources: list, audio_file: str = None):
     source_urls = ",".join([s.get("source_url", "") for s in sources[:2]])
 
     # Extract audio filename (e.g., "audio_0.mp3" from "../audio/audio_0.mp3")
-    audio_name = ""
-    if audio_file:
-        audio_name = audio_file.split("/")[-1] if "/" in audio_file else audio_file
+    audio_name = audio_file.rpartition("/")[2] if audio_file else ""
 
-    # Format: timestamp|names|scores|urls|audio|fact (6 fields)
-    line = f"{timestamp}|{source_names}|{source_scores}|{source_urls}|{audio_name}|{fact}\n"
+    get_daily_log_file().write(DAILY_LOG_LINE % (
+        timestamp, source_names, source_scores, source_urls, audio_name, fact))
 
-    # Create header if new file
-    if not log_file.exists():
-        with open(log_file, 'w') as f:
-            f.write(f"# JTF News Daily Log\n")
-            f.write(f"# Date: {today}\n")
-            f.write(f"# Generated: UTC\n\n")
+    # Also update stories.json for JS loop
+    update_stories_json(fact, sources, source_text, audio_file)
 
-    with open(log_file, 'a') as f:
-        f.write(line)
 
-    # Also update stories.json for JS loop
-    update_stories_json(fact, sources, audio_file)
+def flush_stories_json():
+    """Write pending stories.json changes (atomically) and copy to docs."""
+    global _stories_read_cache, _stories_dirty
+    if not _stories_dirty:
+        return
+
+    stories_file = DATA_DIR / "stories.json"
+    stories = _stories_read_cache[2]
+    write_json_file(stories_file, stories)
+
+    st = stories_file.stat()
+    _stories_read_cache = (st.st_mtime_ns, st.st_size, stories)
+    _stories_dirty = False
+
+    # Also copy to docs for screensaver
+    docs_dir = BASE_DIR / "docs"
+    if docs_dir.exists():
+        shutil.copy(stories_file, docs_dir / "stories.json")
 
 
 def generate_story_id(date: str, index: int) -> str:
@@ -2105,26 +2411,28 @@ def generate_story_id(date: str, index: int) -> str:
     return f"{date}-{index:03d}"
 
 
-def update_stories_json(fact: str, sources: list, audio_file: str = None):
-    """Update stories.json for the JS loop display."""
-    stories_file = DATA_DIR / "stories.json"
+def update_stories_json(fact: str, sources: list, source_text: str, audio_file: str = None):
+    """Add a story to stories.json for the JS loop display.
+
+    The story is added to the in-memory copy, which readers get through
+    load_stories_data(); flush_stories_json() writes the file at the end of
+    the cycle and before anything rewrites it.
+    """
+    global _stories_read_cache, _stories_dirty
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     now_iso = datetime.now(timezone.utc).isoformat()
 
-    # Load existing stories
-    stories = {"date": today, "stories": []}
-    if stories_file.exists():
-        try:
-            with open(stories_file) as f:
-                stories = json.load(f)
-            # Reset if it's a new day
-            if stories.get("date") != today:
-                stories = {"date": today, "stories": []}
-        except:
-            pass
-
-    # Format source info with evidence-based ratings (shows "+N more" if 3+ sources)
-    source_text = format_source_attribution(sources)
+    # Load existing stories (parsed once, then kept in memory)
+    try:
+        stories = load_stories_data()
+    except Exception:
+        stories = None
+    # Reset if it's a new day, first writing out any of yesterday's
+    # stories this cycle published before midnight
+    if not stories or stories.get("date") != today:
+        if _stories_dirty:
+            flush_stories_json()
+        stories = {"date": today, "stories": []}
 
     # Generate story ID and hash
     story_index = len(stories["stories"])
@@ -2159,25 +2467,166 @@ def update_stories_json(fact: str, sources: list, audio_file: str = None):
         "status": "published"
     })
 
-    # Write back
-    with open(stories_file, 'w') as f:
-        json.dump(stories, f, indent=2)
+    cache_key = _stories_read_cache[:2] if _stories_read_cache else (None, None)
+    _stories_read_cache = (*cache_key, stories)
+    _stories_dirty = True
+
+    # Queue for the RSS feed (written and pushed at end of cycle)
+    queue_rss_item(fact, sources)
+
+    # Update Alexa Flash Briefing feed
+    update_alexa_feed(fact, sources)
+
+
+def parse_feed_root(feed_file: Path):
+    """Parse one of our XML feeds for reading and return its root element.
+
+    Uses lxml when installed (much faster on a full feed). The result is only
+    read via find()/findall()/get()/text; feeds are rebuilt and written with
+    ElementTree.
+    """
+    if lxml_etree is not None:
+        parser = lxml_etree.XMLParser(resolve_entities=False)
+        return lxml_etree.parse(str(feed_file), parser).getroot()
+    return ET.parse(feed_file).getroot()
+
+
+# Indent feed.xml for reading by hand (JTF_PRETTY_XML=1); feed readers don't
+# need it and it costs an extra tree walk plus ~30% more bytes per write
+PRETTY_RSS = os.getenv("JTF_PRETTY_XML", "") not in ("", "0")
+
+# Stories published this cycle, oldest first; written by flush_rss_feed()
+_pending_rss_items: list = []
+
+
+def queue_rss_item(fact: str, sources: list):
+    """Queue a new story for the RSS feed.
+
+    Items are built now (so pubDate and ratings reflect publication time)
+    and written to feed.xml in one batch by flush_rss_feed().
+    """
+    # Build rich source data for each source (top 2)
+    rich_sources = []
+    for s in sources[:2]:
+        source_data = get_source_for_rss(s['source_id'])
+        rich_sources.append(source_data)
+
+    # Create new item
+    pub_date = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
+    guid = hashlib.blake2b(f"{fact}{pub_date}".encode(), digest_size=6).hexdigest()
+
+    # Truncate fact for title (first 80 chars)
+    title = fact[:80] + "..." if len(fact) > 80 else fact
+
+    _pending_rss_items.append({
+        "title": title,
+        "description": fact,
+        "sources": rich_sources,
+        "pubDate": pub_date,
+        "guid": guid
+    })
+
+
+# Parsed feed.xml items: (mtime_ns, size, items); refreshed by flush_rss_feed()
+_rss_items_cache = None
+
+
+def load_rss_items(feed_file: Path) -> list:
+    """Load feed.xml items as dicts, re-parsing only when the file has changed.
+
+    flush_rss_feed() records what it writes, so the feed is normally parsed
+    once per process; corrections and digests that rewrite feed.xml change
+    its mtime and trigger a re-parse. Returns a new list; the dicts are shared.
+    """
+    global _rss_items_cache
+    JTF_NS = "https://jtfnews.com/rss"
+
+    try:
+        st = feed_file.stat()
+    except FileNotFoundError:
+        return []
+
+    key = (st.st_mtime_ns, st.st_size)
+    if _rss_items_cache is not None and _rss_items_cache[:2] == key:
+        return list(_rss_items_cache[2])
+
+    items = []
+    try:
+        root = parse_feed_root(feed_file)
+        channel = root.find("channel")
+        for item in channel.findall("item"):
+            # Parse rich source structure (check both namespaced and non-namespaced)
+            item_sources = []
+            # Try namespaced version first
+            for source_el in item.findall(f"{{{JTF_NS}}}source"):
+                source_data = {
+                    "name": source_el.get("name", ""),
+                    "url": source_el.get("url", ""),
+                    "accuracy": source_el.get("accuracy", "0.0"),
+                    "bias": source_el.get("bias", "0.0"),
+                    "speed": source_el.get("speed", "0.0"),
+                    "consensus": source_el.get("consensus", "0.0"),
+                    "control_type": source_el.get("control_type", "unknown"),
+                    "owners": []
+                }
+                for owner_el in source_el.findall(f"{{{JTF_NS}}}owner"):
+                    source_data["owners"].append({
+                        "name": owner_el.get("name", ""),
+                        "percent": owner_el.get("percent", "0.0")
+                    })
+                item_sources.append(source_data)
+
+            # Fall back to non-namespaced (legacy migration)
+            if not item_sources:
+                for source_el in item.findall("source"):
+                    if source_el.get("name"):
+                        source_data = {
+                            "name": source_el.get("name", ""),
+                            "url": source_el.get("url", ""),
+                            "accuracy": source_el.get("accuracy", "0.0"),
+                            "bias": source_el.get("bias", "0.0"),
+                            "speed": source_el.get("speed", "0.0"),
+                            "consensus": source_el.get("consensus", "0.0"),
+                            "control_type": source_el.get("control_type", "unknown"),
+                            "owners": []
+                        }
+                        for owner_el in source_el.findall("owner"):
+                            source_data["owners"].append({
+                                "name": owner_el.get("name", ""),
+                                "percent": owner_el.get("percent", "0.0")
+                            })
+                        item_sources.append(source_data)
+                    elif source_el.text:
+                        # Very old format: plain text
+                        for name in source_el.text.split(", "):
+                            item_sources.append({
+                                "name": name.strip(),
+                                "url": "",
+                                "accuracy": "0.0", "bias": "0.0",
+                                "speed": "0.0", "consensus": "0.0",
+                                "control_type": "unknown", "owners": []
+                            })
 
-    # Also copy to docs for screensaver
-    docs_dir = BASE_DIR / "docs"
-    if docs_dir.exists():
-        import shutil
-        shutil.copy(stories_file, docs_dir / "stories.json")
+            items.append({
+                "title": item.find("title").text or "",
+                "description": item.find("description").text or "",
+                "sources": item_sources,
+                "pubDate": item.find("pubDate").text or "",
+                "guid": item.find("guid").text or ""
+            })
+    except Exception as e:
+        log.warning(f"Error parsing existing RSS feed: {e}")
+        return items
 
-    # Update RSS feed
-    update_rss_feed(fact, sources)
+    _rss_items_cache = (*key, items)
+    return list(items)
 
-    # Update Alexa Flash Briefing feed
-    update_alexa_feed(fact, sources)
 
+def flush_rss_feed():
+    """Write this cycle's queued stories to the RSS feed and push to GitHub.
 
-def update_rss_feed(fact: str, sources: list):
-    """Update RSS feed with new story and push to GitHub.
+    Writes feed.xml and pushes it (with stories.json) once per cycle instead
+    of once per story; existing items come from load_rss_items().
 
     Per SPECIFICATION.md Section 5.3.3, each source element includes:
     - name, accuracy, bias, speed, consensus as attributes
@@ -2185,7 +2634,9 @@ def update_rss_feed(fact: str, sources: list):
 
     Uses jtf: namespace for custom elements to comply with RSS 2.0.
     """
-    import subprocess
+    global _rss_items_cache
+    if not _pending_rss_items:
+        return
 
     # Namespace URIs
     JTF_NS = "https://jtfnews.com/rss"
@@ -2202,101 +2653,19 @@ def update_rss_feed(fact: str, sources: list):
     # Check if docs folder exists
     if not docs_dir.exists():
         log.warning("docs worktree not found, skipping RSS update")
+        _pending_rss_items.clear()
         return
 
-    # Build rich source data for each source (top 2)
-    rich_sources = []
-    for s in sources[:2]:
-        source_data = get_source_for_rss(s['source_id'])
-        rich_sources.append(source_data)
-
-    # Create new item
-    pub_date = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
-    guid = hashlib.md5(f"{fact}{pub_date}".encode()).hexdigest()[:12]
-
-    # Truncate fact for title (first 80 chars)
-    title = fact[:80] + "..." if len(fact) > 80 else fact
-
-    new_item = {
-        "title": title,
-        "description": fact,
-        "sources": rich_sources,
-        "pubDate": pub_date,
-        "guid": guid
-    }
-
-    # Load existing items or create new
-    items = []
-    if feed_file.exists():
-        try:
-            tree = ET.parse(feed_file)
-            root = tree.getroot()
-            channel = root.find("channel")
-            for item in channel.findall("item"):
-                # Parse rich source structure (check both namespaced and non-namespaced)
-                item_sources = []
-                # Try namespaced version first
-                for source_el in item.findall(f"{{{JTF_NS}}}source"):
-                    source_data = {
-                        "name": source_el.get("name", ""),
-                        "url": source_el.get("url", ""),
-                        "accuracy": source_el.get("accuracy", "0.0"),
-                        "bias": source_el.get("bias", "0.0"),
-                        "speed": source_el.get("speed", "0.0"),
-                        "consensus": source_el.get("consensus", "0.0"),
-                        "control_type": source_el.get("control_type", "unknown"),
-                        "owners": []
-                    }
-                    for owner_el in source_el.findall(f"{{{JTF_NS}}}owner"):
-                        source_data["owners"].append({
-                            "name": owner_el.get("name", ""),
-                            "percent": owner_el.get("percent", "0.0")
-                        })
-                    item_sources.append(source_data)
-
-                # Fall back to non-namespaced (legacy migration)
-                if not item_sources:
-                    for source_el in item.findall("source"):
-                        if source_el.get("name"):
-                            source_data = {
-                                "name": source_el.get("name", ""),
-                                "url": source_el.get("url", ""),
-                                "accuracy": source_el.get("accuracy", "0.0"),
-                                "bias": source_el.get("bias", "0.0"),
-                                "speed": source_el.get("speed", "0.0"),
-                                "consensus": source_el.get("consensus", "0.0"),
-                                "control_type": source_el.get("control_type", "unknown"),
-                                "owners": []
-                            }
-                            for owner_el in source_el.findall("owner"):
-                                source_data["owners"].append({
-                                    "name": owner_el.get("name", ""),
-                                    "percent": owner_el.get("percent", "0.0")
-                                })
-                            item_sources.append(source_data)
-                        elif source_el.text:
-                            # Very old format: plain text
-                            for name in source_el.text.split(", "):
-                                item_sources.append({
-                                    "name": name.strip(),
-                                    "url": "",
-                                    "accuracy": "0.0", "bias": "0.0",
-                                    "speed": "0.0", "consensus": "0.0",
-                                    "control_type": "unknown", "owners": []
-                                })
+    # Newest first, matching the feed order
+    new_items = _pending_rss_items[::-1]
+    _pending_rss_items.clear()
+    pub_date = new_items[0]["pubDate"]
 
-                items.append({
-                    "title": item.find("title").text or "",
-                    "description": item.find("description").text or "",
-                    "sources": item_sources,
-                    "pubDate": item.find("pubDate").text or "",
-                    "guid": item.find("guid").text or ""
-                })
-        except Exception as e:
-            log.warning(f"Error parsing existing RSS feed: {e}")
+    # Load existing items
+    items = load_rss_items(feed_file)
 
-    # Add new item at beginning
-    items.insert(0, new_item)
+    # Add new items at beginning
+    items[:0] = new_items
 
     # Trim to max items
     items = items[:max_items]
@@ -2347,8 +2716,9 @@ def update_rss_feed(fact: str, sources: list):
         ET.SubElement(item, "pubDate").text = item_data["pubDate"]
         ET.SubElement(item, "guid", isPermaLink="false").text = item_data["guid"]
 
-    # Write with XML declaration (use custom indent for Python 3.8 compatibility)
-    indent_xml(rss, space="  ")
+    # Write with XML declaration (indent only on request; readers don't need it)
+    if PRETTY_RSS:
+        indent_xml(rss, space="  ")
     tree = ET.ElementTree(rss)
     with open(feed_file, 'wb') as f:
         tree.write(f, encoding="utf-8", xml_declaration=True)
@@ -2356,26 +2726,33 @@ def update_rss_feed(fact: str, sources: list):
     # Clean up duplicate namespace declarations (ElementTree quirk)
     clean_duplicate_namespaces(feed_file)
 
-    log.info(f"RSS feed updated: {len(items)} items")
+    # Remember what was written so the next flush needn't re-parse it
+    st = feed_file.stat()
+    _rss_items_cache = (st.st_mtime_ns, st.st_size, items)
+
+    log.info(f"RSS feed updated: {len(new_items)} new, {len(items)} items")
 
     # Push to GitHub via API
+    flush_stories_json()
     stories_file = DATA_DIR / "stories.json"
-    push_to_ghpages([
+    if len(new_items) == 1:
+        commit_message = f"Update feed: {new_items[0]['title'][:50]}"
+    else:
+        commit_message = f"Update feed: {len(new_items)} stories"
+    run_in_background(push_to_ghpages, [
         (feed_file, "feed.xml"),
         (stories_file, "stories.json")
-    ], f"Update feed: {title[:50]}")
+    ], commit_message)
 
 
 def add_correction_to_rss(correction_type: str, original_fact: str,
                           corrected_fact: str, sources: list, story_id: str):
     """Add a correction/retraction item to the RSS feed.
 
-    Uses same rich source format as update_rss_feed for consistency.
+    Uses same rich source format as flush_rss_feed for consistency.
     Corrections only have source names (not IDs), so ratings are omitted.
     Uses jtf: namespace for custom elements to comply with RSS 2.0.
     """
-    import subprocess
-
     # Namespace URIs
     JTF_NS = "https://jtfnews.com/rss"
     ATOM_NS = "http://www.w3.org/2005/Atom"
@@ -2404,7 +2781,7 @@ def add_correction_to_rss(correction_type: str, original_fact: str,
         description = f"CORRECTION: Earlier we reported that {original_fact}. {source_text} now report that {corrected_fact}."
 
     pub_date = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
-    guid = hashlib.md5(f"correction-{story_id}-{pub_date}".encode()).hexdigest()[:12]
+    guid = hashlib.blake2b(f"correction-{story_id}-{pub_date}".encode(), digest_size=6).hexdigest()
 
     # Build source data (corrections only have names, not full ratings)
     rich_sources = []
@@ -2424,12 +2801,11 @@ def add_correction_to_rss(correction_type: str, original_fact: str,
         "guid": guid
     }
 
-    # Load existing items (same parsing logic as update_rss_feed)
+    # Load existing items (same parsing logic as flush_rss_feed)
     items = []
     if feed_file.exists():
         try:
-            tree = ET.parse(feed_file)
-            root = tree.getroot()
+            root = parse_feed_root(feed_file)
             channel = root.find("channel")
             for item in channel.findall("item"):
                 item_sources = []
@@ -2539,7 +2915,8 @@ def add_correction_to_rss(correction_type: str, original_fact: str,
         ET.SubElement(item, "guid", isPermaLink="false").text = item_data["guid"]
 
     # Write with XML declaration
-    indent_xml(rss, space="  ")
+    if PRETTY_RSS:
+        indent_xml(rss, space="  ")
     tree = ET.ElementTree(rss)
     with open(feed_file, 'wb') as f:
         tree.write(f, encoding="utf-8", xml_declaration=True)
@@ -2573,6 +2950,7 @@ def regenerate_rss_feed():
 
     docs_dir = BASE_DIR / "docs"
     feed_file = docs_dir / "feed.xml"
+    flush_stories_json()
     stories_file = docs_dir / "stories.json"
 
     if not stories_file.exists():
@@ -2598,7 +2976,6 @@ def regenerate_rss_feed():
         rich_sources = []
         for part in source_str.split(" · "):
             # Extract source name (everything before the first digit or asterisk)
-            import re
             match = re.match(r'^([A-Za-z\s\-\.]+)', part.strip())
             if match:
                 source_name = match.group(1).strip()
@@ -2641,8 +3018,7 @@ def regenerate_rss_feed():
     # Also preserve any existing items not in stories.json (e.g., from previous days)
     if feed_file.exists():
         try:
-            tree = ET.parse(feed_file)
-            root = tree.getroot()
+            root = parse_feed_root(feed_file)
             channel = root.find("channel")
             existing_guids = {item["guid"] for item in items}
             for item in channel.findall("item"):
@@ -2761,7 +3137,8 @@ def regenerate_rss_feed():
         ET.SubElement(item, "guid", isPermaLink="false").text = item_data["guid"]
 
     # Write with XML declaration
-    indent_xml(rss, space="  ")
+    if PRETTY_RSS:
+        indent_xml(rss, space="  ")
     tree = ET.ElementTree(rss)
     with open(feed_file, 'wb') as f:
         tree.write(f, encoding="utf-8", xml_declaration=True)
@@ -2778,8 +3155,6 @@ def add_digest_to_feed(date: str, story_count: int, youtube_id: str):
 
     Creates a special item with jtf:type="digest" attribute.
     """
-    import subprocess
-
     # Namespace URIs
     JTF_NS = "https://jtfnews.com/rss"
     ATOM_NS = "http://www.w3.org/2005/Atom"
@@ -2887,23 +3262,11 @@ def add_digest_to_feed(date: str, story_count: int, youtube_id: str):
 
         log.info(f"Added digest entry for {date} to RSS feed")
 
-        # Push to GitHub
-        try:
-            subprocess.run(
-                ["git", "-C", str(docs_dir), "add", "feed.xml"],
-                capture_output=True, check=True
-            )
-            subprocess.run(
-                ["git", "-C", str(docs_dir), "commit", "-m", f"Add digest entry for {date}"],
-                capture_output=True, check=True
-            )
-            subprocess.run(
-                ["git", "-C", str(docs_dir), "push"],
-                capture_output=True, check=True
-            )
+        # Push to GitHub via API (one request pair, no git processes)
+        if push_to_ghpages([(feed_file, "feed.xml")], f"Add digest entry for {date}"):
             log.info("Pushed digest feed entry to GitHub")
-        except subprocess.CalledProcessError as e:
-            log.warning(f"Could not push digest entry to GitHub: {e}")
+        else:
+            log.warning("Could not push digest entry to GitHub")
 
     except Exception as e:
         log.error(f"Failed to add digest to feed: {e}")
@@ -2911,8 +3274,6 @@ def add_digest_to_feed(date: str, story_count: int, youtube_id: str):
 
 def update_alexa_feed(fact: str, sources: list):
     """Update Alexa Flash Briefing JSON feed and push to GitHub."""
-    import subprocess
-
     docs_dir = BASE_DIR / "docs"
     alexa_file = docs_dir / "alexa.json"
     max_items = 5  # Alexa typically reads top few items
@@ -2939,12 +3300,11 @@ def update_alexa_feed(fact: str, sources: list):
 
     # Load existing items or create new list
     items = []
-    if alexa_file.exists():
-        try:
-            with open(alexa_file) as f:
-                items = json.load(f)
-        except:
-            pass
+    try:
+        with open(alexa_file) as f:
+            items = json.load(f)
+    except:
+        pass
 
     # Add new item at beginning
     items.insert(0, new_item)
@@ -2952,14 +3312,13 @@ def update_alexa_feed(fact: str, sources: list):
     # Trim to max items
     items = items[:max_items]
 
-    # Write JSON
-    with open(alexa_file, 'w') as f:
-        json.dump(items, f, indent=2)
+    # Write JSON (atomically: a background push may be reading the previous version)
+    write_json_file(alexa_file, items)
 
     log.info(f"Alexa feed updated: {len(items)} items")
 
     # Push to GitHub via API
-    push_to_ghpages([(alexa_file, "alexa.json")], "Update Alexa feed")
+    run_in_background(push_to_ghpages, [(alexa_file, "alexa.json")], "Update Alexa feed")
 
 
 # =============================================================================
@@ -2984,11 +3343,13 @@ def send_alert(message: str, alert_type: str = "general"):
         log.warning(f"Alert (Twilio unavailable): {message}")
         return
 
+    run_in_background(send_alert_sms, message)
+
+
+def send_alert_sms(message: str):
+    """Send an alert SMS via Twilio (runs on the background I/O pool)."""
     try:
-        client = TwilioClient(
-            os.getenv("TWILIO_ACCOUNT_SID"),
-            os.getenv("TWILIO_AUTH_TOKEN")
-        )
+        client = get_twilio_client()
 
         client.messages.create(
             body=f"JTF: {message}",
@@ -3014,7 +3375,7 @@ def send_alert(message: str, alert_type: str = "general"):
 HEARTBEAT_FILE = DATA_DIR / "heartbeat.txt"
 STREAM_OFFLINE_THRESHOLD = 300  # 5 minutes in seconds
 _offline_alert_sent = False  # Only ONE alert per offline event
-_midnight_archive_done_for = None  # Idempotency guard: prevents multiple runs in 00:00-00:05 window
+_last_archive_date = None  # UTC date whose midnight archive has run (set on first check)
 
 
 def write_heartbeat():
@@ -3065,11 +3426,12 @@ def check_stream_health():
 
 def get_recent_facts(hours: int = 24) -> list:
     """Get facts published in the last N hours."""
+    flush_daily_log()
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     log_file = DATA_DIR / f"{today}.txt"
 
     facts = []
-    if log_file.exists():
+    try:
         with open(log_file) as f:
             for line in f:
                 if line.startswith("#") or not line.strip():
@@ -3077,6 +3439,8 @@ def get_recent_facts(hours: int = 24) -> list:
                 parts = line.strip().split("|")
                 if len(parts) >= 4:
                     facts.append(parts[3].strip())
+    except FileNotFoundError:
+        pass
 
     return facts[-20:]  # Last 20 facts max
 
@@ -3102,7 +3466,7 @@ Minor updates or additions are NOT contradictions.
 Return JSON: {{"contradiction": true/false, "reason": "brief explanation if true"}}"""
 
     try:
-        client = anthropic.Anthropic()
+        client = get_claude_client()
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=100,
@@ -3143,12 +3507,11 @@ CORRECTIONS_FILE = DATA_DIR / "corrections.json"
 
 def load_corrections() -> dict:
     """Load corrections log from disk."""
-    if CORRECTIONS_FILE.exists():
-        try:
-            with open(CORRECTIONS_FILE) as f:
-                return json.load(f)
-        except:
-            pass
+    try:
+        with open(CORRECTIONS_FILE) as f:
+            return json.load(f)
+    except:
+        pass
     return {"last_updated": None, "corrections": []}
 
 
@@ -3169,49 +3532,45 @@ def save_corrections(corrections: dict):
 
 def get_recent_stories_for_correction(days: int = 7) -> list:
     """Get recent stories with full metadata for correction checking."""
-    stories_file = DATA_DIR / "stories.json"
+    flush_daily_log()
     all_stories = []
 
-    # Get today's stories
-    if stories_file.exists():
-        try:
-            with open(stories_file) as f:
-                data = json.load(f)
-                for i, story in enumerate(data.get("stories", [])):
-                    # Add index for reference
-                    story["_index"] = i
-                    story["_date"] = data.get("date", "")
-                    all_stories.append(story)
-        except:
-            pass
+    # Get today's stories (in-memory copy, including this cycle's unflushed ones)
+    try:
+        data = load_stories_data() or {}
+        for i, story in enumerate(data.get("stories", [])):
+            # Copy before adding the index; the loaded data is shared
+            story = dict(story, _index=i, _date=data.get("date", ""))
+            all_stories.append(story)
+    except:
+        pass
 
     # Also check archived daily logs for recent days
     today = datetime.now(timezone.utc)
     for day_offset in range(1, days):
         check_date = (today - timedelta(days=day_offset)).strftime("%Y-%m-%d")
         log_file = DATA_DIR / f"{check_date}.txt"
-        if log_file.exists():
-            try:
-                with open(log_file) as f:
-                    for line_num, line in enumerate(f):
-                        if line.startswith("#") or not line.strip():
-                            continue
-                        parts = line.strip().split("|")
-                        if len(parts) >= 4:
-                            fact = parts[3].strip()
-                            story_id = generate_story_id(check_date, line_num)
-                            all_stories.append({
-                                "id": story_id,
-                                "hash": hashlib.md5(fact.encode()).hexdigest()[:12],
-                                "fact": fact,
-                                "source": parts[1] if len(parts) > 1 else "",
-                                "published_at": f"{check_date}T{parts[0]}:00Z",
-                                "status": "published",
-                                "_date": check_date,
-                                "_from_archive": True
-                            })
-            except:
-                pass
+        try:
+            with open(log_file) as f:
+                for line_num, line in enumerate(f):
+                    if line.startswith("#") or not line.strip():
+                        continue
+                    parts = line.strip().split("|")
+                    if len(parts) >= 4:
+                        fact = parts[3].strip()
+                        story_id = generate_story_id(check_date, line_num)
+                        all_stories.append({
+                            "id": story_id,
+                            "hash": hashlib.md5(fact.encode()).hexdigest()[:12],
+                            "fact": fact,
+                            "source": parts[1] if len(parts) > 1 else "",
+                            "published_at": f"{check_date}T{parts[0]}:00Z",
+                            "status": "published",
+                            "_date": check_date,
+                            "_from_archive": True
+                        })
+        except:
+            pass
 
     return all_stories
 
@@ -3267,7 +3626,7 @@ If NO correction needed, return:
 {{"needs_correction": false}}"""
 
     try:
-        client = anthropic.Anthropic()
+        client = get_claude_client()
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=200,
@@ -3307,6 +3666,7 @@ def issue_correction(story_id: str, original_fact: str, corrected_fact: str,
     # Normalize story_id - Claude may return it with brackets from prompt formatting
     story_id = story_id.strip("[]")
 
+    flush_stories_json()
     stories_file = DATA_DIR / "stories.json"
     now_iso = datetime.now(timezone.utc).isoformat()
 
@@ -3336,8 +3696,7 @@ def issue_correction(story_id: str, original_fact: str, corrected_fact: str,
             break
 
     if story_updated:
-        with open(stories_file, 'w') as f:
-            json.dump(stories, f, indent=2)
+        write_json_file(stories_file, stories)
         log.info(f"Story {story_id} marked as corrected")
     else:
         log.warning(f"Correction target not found: story_id={story_id} not in stories.json")
@@ -3387,6 +3746,7 @@ def issue_retraction(story_id: str, original_fact: str, reason: str, sources: li
     # Normalize story_id - Claude may return it with brackets from prompt formatting
     story_id = story_id.strip("[]")
 
+    flush_stories_json()
     stories_file = DATA_DIR / "stories.json"
     now_iso = datetime.now(timezone.utc).isoformat()
 
@@ -3414,8 +3774,7 @@ def issue_retraction(story_id: str, original_fact: str, reason: str, sources: li
             break
 
     if story_found:
-        with open(stories_file, 'w') as f:
-            json.dump(stories, f, indent=2)
+        write_json_file(stories_file, stories)
         log.info(f"Story {story_id} marked as retracted")
     else:
         log.warning(f"Retraction target not found: story_id={story_id} not in stories.json")
@@ -3496,17 +3855,12 @@ def generate_retraction_audio(original_fact: str, reason: str, sources: list):
 
 def find_matching_published_story(new_fact: str) -> dict | None:
     """Check if new fact matches any already-published story today."""
-    stories_file = DATA_DIR / "stories.json"
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-    if not stories_file.exists():
-        return None
-
     try:
-        with open(stories_file) as f:
-            data = json.load(f)
+        data = load_stories_data()
 
-        if data.get("date") != today:
+        if not data or data.get("date") != today:
             return None
 
         # Use same word overlap filter as queue matching
@@ -3521,9 +3875,8 @@ def find_matching_published_story(new_fact: str) -> dict | None:
             min_len = min(len(new_words), len(existing_words))
 
             if min_len > 0 and overlap / min_len > 0.3:
-                # Potential match - return story with index
-                story["_index"] = idx
-                return story
+                # Potential match - return a copy with index (the loaded data is shared)
+                return dict(story, _index=idx)
 
         return None
 
@@ -3653,7 +4006,7 @@ If there is NO new information, return exactly: NO_NEW_INFO
 Return JSON: {{"new_detail": "the new sentence" or "NO_NEW_INFO"}}"""
 
     try:
-        client = anthropic.Anthropic()
+        client = get_claude_client()
         response = client.messages.create(
             model=CONFIG["claude"]["model"],
             max_tokens=100,
@@ -3689,6 +4042,7 @@ Return JSON: {{"new_detail": "the new sentence" or "NO_NEW_INFO"}}"""
 
 def update_published_story(story_index: int, additional_detail: str, new_source: dict):
     """Append new detail to an already-published story."""
+    flush_stories_json()
     stories_file = DATA_DIR / "stories.json"
 
     try:
@@ -3719,8 +4073,7 @@ def update_published_story(story_index: int, additional_detail: str, new_source:
             story["audio"] = f"../audio/archive/{today}/{new_audio_file}"
 
         # Write back
-        with open(stories_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json_file(stories_file, data)
 
         log.info(f"UPDATED story: +'{additional_detail}' from {new_source['source_name']}")
         return True
@@ -3930,6 +4283,7 @@ def load_stories_for_date(date: str) -> list:
     Returns:
         List of story dicts with 'fact' and 'source' fields
     """
+    flush_daily_log()
     log_file = DATA_DIR / f"{date}.txt"
     lines = []
 
@@ -3948,7 +4302,7 @@ def load_stories_for_date(date: str) -> list:
         if archive_file.exists():
             log.info(f"Loading from archive: {archive_file}")
             try:
-                with gzip.open(archive_file, 'rt', encoding='utf-8') as f:
+                with igzip.open(archive_file, 'rt', encoding='utf-8') as f:
                     lines = f.readlines()
             except Exception as e:
                 log.error(f"Error reading archive for {date}: {e}")
@@ -4507,7 +4861,7 @@ def generate_and_upload_daily_summary(date: str):
         # Priority 1: Hash-based filename (always correct if exists)
         # This takes priority because hash guarantees content match
         if fact:
-            fact_hash = get_story_hash(fact)
+            fact_hash = get_story_audio_id(fact)
             hash_candidate = archive_dir / f"{fact_hash}.mp3"
             if hash_candidate.exists():
                 audio_path = hash_candidate
@@ -4711,11 +5065,12 @@ def generate_and_upload_daily_summary(date: str):
         # Upload to YouTube
         _upload_video_to_youtube(str(video_path), date)
 
-        # Podcast pipeline: convert to MP3, upload to Archive.org, update feeds
+        # Podcast pipeline: extract audio, upload to Archive.org, update feeds
         try:
-            mp3_path = str(video_path).replace('.mp4', '.mp3')
-            if convert_video_to_podcast_audio(str(video_path), mp3_path):
-                archive_result = upload_to_archive_org(date, mp3_path, str(video_path))
+            prepared = prepare_podcast_audio(str(video_path))
+            if prepared:
+                audio_path, audio_data = prepared
+                archive_result = upload_to_archive_org(date, audio_path, str(video_path), audio_data=audio_data)
                 facts = [s["fact"] for s in stories_data if s.get("fact")]
                 update_podcast_feeds(date, archive_result, len(stories_data), int(estimated_duration), facts=facts)
                 push_podcast_feeds()
@@ -4727,15 +5082,16 @@ def generate_and_upload_daily_summary(date: str):
                     podcast_updated=True
                 )
                 log.info(f"Podcast published: {archive_result['audio_url']}")
-                # Clean up temporary MP3 - Archive.org is the permanent store
-                try:
-                    Path(mp3_path).unlink()
-                    log.info(f"Deleted temporary MP3: {mp3_path}")
-                except Exception as e:
-                    log.warning(f"Could not delete temporary MP3: {e}")
+                # Clean up temporary audio - Archive.org is the permanent store
+                if audio_data is None:
+                    try:
+                        Path(audio_path).unlink()
+                        log.info(f"Deleted temporary podcast audio: {audio_path}")
+                    except Exception as e:
+                        log.warning(f"Could not delete temporary podcast audio: {e}")
             else:
-                log.error("Podcast MP3 conversion failed")
-                send_alert(f"Podcast MP3 conversion failed for {date}")
+                log.error("Podcast audio conversion failed")
+                send_alert(f"Podcast audio conversion failed for {date}")
         except Exception as e:
             log.error(f"Podcast pipeline failed: {e}")
             send_alert(f"Podcast upload failed for {date}: {e}")
@@ -4773,7 +5129,6 @@ def trim_video_silence(video_path: str) -> bool:
         True if processing succeeded, False otherwise
     """
     import subprocess
-    import re
 
     video_path = Path(video_path)
     if not video_path.exists():
@@ -5003,30 +5358,111 @@ def _upload_video_to_youtube(video_path: str, date: str):
 # PODCAST PIPELINE (Archive.org + RSS Feeds)
 # =============================================================================
 
+def get_audio_codec(video_path: str) -> str | None:
+    """Get the codec of the first audio stream (e.g. 'aac') via ffprobe."""
+    import subprocess
+    try:
+        result = subprocess.run(
+            ['ffprobe', '-v', 'error', '-select_streams', 'a:0',
+             '-show_entries', 'stream=codec_name', '-of', 'csv=p=0', video_path],
+            capture_output=True, text=True, timeout=30
+        )
+        return result.stdout.strip() or None
+    except Exception as e:
+        log.warning(f"Could not probe audio codec for {video_path}: {e}")
+        return None
+
+
+def get_podcast_audio_path(video_path: str, codec: str = None) -> str:
+    """Pick the podcast audio file for a video.
+
+    AAC audio can be stream-copied into an .m4a as-is; anything else is
+    re-encoded to .mp3.
+    """
+    if codec is None:
+        codec = get_audio_codec(video_path)
+    suffix = ".m4a" if codec == "aac" else ".mp3"
+    return str(Path(video_path).with_suffix(suffix))
+
+
 def convert_video_to_podcast_audio(video_path: str, output_path: str) -> bool:
-    """Convert MP4 to 320kbps MP3 using ffmpeg."""
+    """Extract podcast audio from MP4 to output_path using ffmpeg.
+
+    An .m4a output stream-copies the existing AAC track (no re-encode);
+    anything else is encoded to 320kbps MP3.
+    """
+    import subprocess
+    if output_path.endswith('.m4a'):
+        cmd = [
+            'ffmpeg', '-i', video_path,
+            '-vn',              # No video
+            '-c:a', 'copy',     # Keep AAC as-is
+            '-movflags', '+faststart',  # moov atom up front for streaming clients
+            '-y',               # Overwrite output
+            output_path
+        ]
+    else:
+        cmd = [
+            'ffmpeg', '-i', video_path,
+            '-vn',              # No video
+            '-ab', '320k',      # 320kbps bitrate
+            '-ar', '44100',     # 44.1kHz sample rate
+            '-y',               # Overwrite output
+            output_path
+        ]
+    result = subprocess.run(cmd, capture_output=True, timeout=300)
+    if result.returncode != 0:
+        log.error(f"ffmpeg podcast audio conversion failed: {result.stderr.decode(errors='replace')}")
+        return False
+    log.info(f"Converted to podcast audio: {output_path}")
+    return True
+
+
+def pipe_video_to_podcast_mp3(video_path: str) -> bytes | None:
+    """Encode MP4 audio to 320kbps MP3 with ffmpeg, returned in memory.
+
+    The MP3 is piped back from ffmpeg instead of being written to disk.
+    Returns None if conversion fails.
+    """
     import subprocess
     cmd = [
         'ffmpeg', '-i', video_path,
         '-vn',              # No video
         '-ab', '320k',      # 320kbps bitrate
         '-ar', '44100',     # 44.1kHz sample rate
-        '-y',               # Overwrite output
-        output_path
+        '-f', 'mp3', 'pipe:1'
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+    result = subprocess.run(cmd, capture_output=True, timeout=300)
     if result.returncode != 0:
-        log.error(f"ffmpeg MP3 conversion failed: {result.stderr}")
-        return False
-    log.info(f"Converted to podcast audio: {output_path}")
-    return True
+        log.error(f"ffmpeg podcast audio conversion failed: {result.stderr.decode(errors='replace')}")
+        return None
+    log.info(f"Converted to podcast audio in memory ({len(result.stdout)} bytes)")
+    return result.stdout
+
+
+def prepare_podcast_audio(video_path: str, codec: str = None) -> tuple | None:
+    """Produce podcast audio for a video, ready for upload_to_archive_org().
+
+    Returns (audio_path, audio_data). AAC is stream-copied to audio_path on
+    disk (the MP4 muxer needs a seekable output) and audio_data is None;
+    otherwise the MP3 stays in memory as audio_data and nothing is written.
+    Returns None if conversion fails.
+    """
+    audio_path = get_podcast_audio_path(video_path, codec)
+    if audio_path.endswith('.m4a'):
+        return (audio_path, None) if convert_video_to_podcast_audio(video_path, audio_path) else None
+    audio_data = pipe_video_to_podcast_mp3(video_path)
+    return (audio_path, audio_data) if audio_data is not None else None
 
 
 @retry_with_backoff(max_retries=3, base_delay=2.0, retryable_exceptions=(ConnectionError, TimeoutError, OSError, Exception))
-def upload_to_archive_org(date: str, mp3_path: str, mp4_path: str) -> dict:
+def upload_to_archive_org(date: str, audio_path: str, mp4_path: str, audio_data: bytes = None) -> dict:
     """Upload episode files to Archive.org.
 
-    Returns dict with item_id, audio_url, video_url, audio_size, video_size.
+    If audio_data is given it is uploaded from memory under audio_path's
+    filename and nothing is read from audio_path.
+
+    Returns dict with item_id, audio_url, video_url, audio_type, audio_size, video_size.
     """
     import internetarchive as ia
 
@@ -5039,18 +5475,32 @@ def upload_to_archive_org(date: str, mp3_path: str, mp4_path: str) -> dict:
 
     # Check if item already exists (idempotent)
     item = ia.get_item(item_id)
+    audio_name = Path(audio_path).name
+    audio_size = None
     if item.exists:
         log.info(f"Archive.org item {item_id} already exists, skipping upload")
+        # The stored audio may predate the AAC stream-copy path (.mp3 vs .m4a)
+        stem = Path(audio_path).stem
+        for f in item.files:
+            if f.get('name') in (f"{stem}.mp3", f"{stem}.m4a"):
+                audio_name = f['name']
+                audio_size = int(f.get('size', 0)) or None
+                break
     else:
-        # Build file list: MP3, MP4, and thumbnail for Archive.org item image
-        upload_files = [mp3_path, mp4_path]
+        # Build file map (remote name -> local path or buffer): audio, MP4,
+        # and thumbnail for Archive.org item image
+        upload_files = {
+            audio_name: io.BytesIO(audio_data) if audio_data is not None else audio_path,
+            Path(mp4_path).name: mp4_path,
+        }
 
         # Add thumbnail as __ia_thumb.jpg so Archive.org uses it as the item image
         thumbnail_src = BASE_DIR / "web" / "assets" / "png" / "thumbnail-youtube-1280x720.png"
         thumb_temp = None
         if thumbnail_src.exists():
-            import shutil
-            thumb_temp = Path(mp3_path).parent / "__ia_thumb.jpg"
+            import tempfile
+            # Per-upload temp dir so parallel uploads don't share one thumbnail file
+            thumb_temp = Path(tempfile.mkdtemp(prefix=f"{item_id}-")) / "__ia_thumb.jpg"
             # Convert PNG to JPEG for Archive.org compatibility
             try:
                 import subprocess
@@ -5059,47 +5509,46 @@ def upload_to_archive_org(date: str, mp3_path: str, mp4_path: str) -> dict:
                     str(thumbnail_src), '--out', str(thumb_temp)
                 ], capture_output=True, timeout=30)
                 if thumb_temp.exists():
-                    upload_files.append(str(thumb_temp))
+                    upload_files[thumb_temp.name] = str(thumb_temp)
                     log.info("Including __ia_thumb.jpg for Archive.org thumbnail")
             except Exception as e:
                 log.warning(f"Could not convert thumbnail to JPEG: {e}")
 
-        ia.upload(
-            item_id,
-            files=upload_files,
-            metadata={
-                'mediatype': 'movies',
-                'collection': 'opensource_movies',
-                'creator': 'JTF News',
-                'date': date,
-                'title': f'JTF News Daily Digest - {date}',
-                'description': 'Daily digest of verified news facts. No opinions, no adjectives.',
-                'licenseurl': 'https://creativecommons.org/licenses/by-sa/4.0/',
-                'subject': ['news', 'daily digest', 'facts', 'journalism']
-            },
-            access_key=access_key,
-            secret_key=secret_key
-        )
-        log.info(f"Uploaded to Archive.org: {item_id}")
-
-        # Clean up temporary thumbnail
-        if thumb_temp and thumb_temp.exists():
-            try:
-                thumb_temp.unlink()
-            except Exception:
-                pass
-
-    audio_size = os.path.getsize(mp3_path)
+        try:
+            ia.upload(
+                item_id,
+                files=upload_files,
+                metadata={
+                    'mediatype': 'movies',
+                    'collection': 'opensource_movies',
+                    'creator': 'JTF News',
+                    'date': date,
+                    'title': f'JTF News Daily Digest - {date}',
+                    'description': 'Daily digest of verified news facts. No opinions, no adjectives.',
+                    'licenseurl': 'https://creativecommons.org/licenses/by-sa/4.0/',
+                    'subject': ['news', 'daily digest', 'facts', 'journalism']
+                },
+                access_key=access_key,
+                secret_key=secret_key
+            )
+            log.info(f"Uploaded to Archive.org: {item_id}")
+        finally:
+            # Clean up temporary thumbnail, also when the upload fails and is retried
+            if thumb_temp:
+                shutil.rmtree(thumb_temp.parent, ignore_errors=True)
+
+    if audio_size is None:
+        audio_size = len(audio_data) if audio_data is not None else os.path.getsize(audio_path)
     video_size = os.path.getsize(mp4_path)
 
     # Filenames on Archive.org match local filenames
-    mp3_name = Path(mp3_path).name
     mp4_name = Path(mp4_path).name
 
     return {
         'item_id': item_id,
-        'audio_url': f'https://archive.org/download/{item_id}/{mp3_name}',
+        'audio_url': f'https://archive.org/download/{item_id}/{audio_name}',
         'video_url': f'https://archive.org/download/{item_id}/{mp4_name}',
+        'audio_type': 'audio/mp4' if audio_name.endswith('.m4a') else 'audio/mpeg',
         'audio_size': audio_size,
         'video_size': video_size
     }
@@ -5170,7 +5619,7 @@ def update_podcast_feeds(date: str, archive_result: dict, story_count: int, dura
       <title>JTF News - {display_date}</title>
       <description>{description}</description>
       <content:encoded><![CDATA[{content_encoded}]]></content:encoded>
-      <enclosure url="{archive_result['audio_url']}" type="audio/mpeg" length="{archive_result['audio_size']}"/>
+      <enclosure url="{archive_result['audio_url']}" type="{archive_result.get('audio_type', 'audio/mpeg')}" length="{archive_result['audio_size']}"/>
       <guid isPermaLink="false">{guid}</guid>
       <pubDate>{pub_date}</pubDate>
       <itunes:duration>{duration_str}</itunes:duration>
@@ -5343,17 +5792,14 @@ def get_queue_stats() -> dict:
 
 def get_stories_today_count() -> int:
     """Count stories published today."""
-    stories_file = DATA_DIR / "stories.json"
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
-    if stories_file.exists():
-        try:
-            with open(stories_file) as f:
-                data = json.load(f)
-            if data.get("date") == today:
-                return len(data.get("stories", []))
-        except:
-            pass
+    try:
+        data = load_stories_data()
+        if data and data.get("date") == today:
+            return len(data.get("stories", []))
+    except:
+        pass
     return 0
 
 
@@ -5536,6 +5982,11 @@ def write_sleeping_heartbeat(minutes_remaining: int, last_cycle_stats: dict = No
     push_monitor_to_ghpages(monitor_file)
 
 
+# Pushes run on the background pool; one at a time so two updates to the
+# same path can't race on its SHA
+_ghpages_lock = threading.Lock()
+
+
 def push_to_ghpages(files: list, commit_message: str):
     """Push files to GitHub branch via GitHub API.
 
@@ -5548,6 +5999,11 @@ def push_to_ghpages(files: list, commit_message: str):
     Returns:
         True if successful, False otherwise
     """
+    with _ghpages_lock:
+        return _push_to_ghpages(files, commit_message)
+
+
+def _push_to_ghpages(files: list, commit_message: str):
     import base64
 
     github_token = os.getenv("GITHUB_TOKEN")
@@ -5620,7 +6076,7 @@ def push_to_ghpages(files: list, commit_message: str):
 
 def push_monitor_to_ghpages(monitor_file: Path):
     """Push monitor.json to GitHub branch via GitHub API."""
-    push_to_ghpages([(monitor_file, "monitor.json")], "Update monitor data")
+    run_in_background(push_to_ghpages, [(monitor_file, "monitor.json")], "Update monitor data")
 
 
 # =============================================================================
@@ -5689,6 +6145,9 @@ def archive_daily_log():
     log_file = DATA_DIR / f"{yesterday_str}.txt"
     hash_file = DATA_DIR / f"shown_{yesterday_str}.txt"
 
+    # Yesterday's handle may still be open if nothing was published since midnight
+    close_daily_log()
+
     if not log_file.exists():
         log.info("No log to archive")
         return
@@ -5708,9 +6167,10 @@ def archive_daily_log():
 
     # Gzip the log
     archive_file = archive_dir / f"{yesterday_str}.txt.gz"
+    # Level 1: log text still compresses well at a fraction of the CPU of 9
     with open(log_file, 'rb') as f_in:
-        with gzip.open(archive_file, 'wb') as f_out:
-            shutil.copyfileobj(f_in, f_out)
+        with gzip.open(archive_file, 'wb', compresslevel=1) as f_out:
+            shutil.copyfileobj(f_in, f_out, length=1 << 20)
 
     log.info(f"Archived: {archive_file}")
 
@@ -5782,36 +6242,34 @@ def process_cycle():
         log.warning("KILL SWITCH ACTIVE - Stopping")
         sys.exit(0)
 
-    # Load queue
-    queue = load_queue()
-    queue = clean_expired_queue(queue)
-
-    # Scrape headlines
-    headlines = scrape_all_sources()
-    log.info(f"Total headlines: {len(headlines)}")
+    # Load queue as fact text -> entries (one per queued copy, any source),
+    # so a verified match drops every copy of its fact in O(1)
+    queue = {}
+    for item in clean_expired_queue(load_queue()):
+        queue.setdefault(item["fact"], []).append(item)
 
     # Load caches (saves API costs by avoiding redundant calls)
     processed_cache = load_processed_headlines()
     global _fact_extraction_cache
     _fact_extraction_cache = load_fact_extraction_cache()
-    skipped_count = 0
+
+    # Scrape headlines; fact extraction starts while scraping continues
+    pending, total_headlines, skipped_count = scrape_and_extract(processed_cache)
+    log.info(f"Total headlines: {total_headlines}")
+
     published_count = 0
     processed_count = 0  # Headlines sent to Claude
     queued_count = 0  # Stories added to queue this cycle
 
-    for headline in headlines:
-        # Skip if already processed (saves API costs)
-        if is_headline_processed(headline["text"], processed_cache):
-            skipped_count += 1
-            continue
-
-        # Mark as processed before calling API
-        add_processed_headline(get_story_hash(headline["text"]))
-
+    for headline_hash, headline, extraction in pending:
         # Extract fact
-        result = extract_fact(headline["text"])
+        result = extraction.result()
         processed_count += 1  # Count headlines sent to Claude
 
+        # Mark processed only now, so headlines left unhandled by a failed
+        # cycle are retried (the fact cache spares the repeat Claude call)
+        add_processed_headline(headline_hash)
+
         # Skip if not a fact
         if result["fact"] == "SKIP":
             continue
@@ -5839,13 +6297,16 @@ def process_cycle():
             log.info(f"Not newsworthy ({threshold_met}): {fact[:40]}...")
             continue
 
-        # Check for duplicates
+        # Check for duplicates: exact text first, then one Claude call that
+        # both checks published stories and looks for matches in the queue
         if is_duplicate(fact):
             log.info(f"Duplicate: {fact[:40]}...")
             continue
 
-        # Look for matching stories in queue
-        matches = find_matching_stories(fact, queue)
+        duplicate, matches = check_duplicate_and_matches(fact, queue_items(queue), load_published_stories())
+        if duplicate:
+            log.info(f"Duplicate: {fact[:40]}...")
+            continue
 
         if matches:
             # Check if any match has unrelated source
@@ -5892,16 +6353,20 @@ def process_cycle():
                     # This ensures audio files are always linked to correct story
                     story_audio_id = get_story_audio_id(best_fact)
 
-                    # Generate TTS first (before JS sees the new story)
+                    # Generate TTS first (the story reaches stories.json with its audio path)
                     audio_file = generate_tts(best_fact, story_id=story_audio_id)
 
-                    # Now write output (JS will detect and play)
-                    write_current_story(best_fact, sources)
-                    append_daily_log(best_fact, sources, audio_file)
+                    # Format source info with evidence-based ratings (shows "+N more" if 3+ sources)
+                    source_text = format_source_attribution(sources)
+
+                    # Now write output (the overlay picks it up when stories.json
+                    # is flushed at the end of the cycle)
+                    write_current_story(best_fact, source_text)
+                    append_daily_log(best_fact, sources, source_text, audio_file)
                     add_shown_hash(get_story_hash(best_fact))
 
                     # Remove from queue
-                    queue = [q for q in queue if q["fact"] != match["fact"]]
+                    queue.pop(match["fact"], None)
 
                     published_count += 1
                     log.info(f"VERIFIED: {best_fact[:50]}...")
@@ -5939,6 +6404,7 @@ def process_cycle():
 
                         # Verify correction was applied to stories.json
                         try:
+                            flush_stories_json()
                             with open(DATA_DIR / "stories.json") as f:
                                 verify = json.load(f)
                             for s in verify.get("stories", []):
@@ -5981,7 +6447,7 @@ def process_cycle():
                 fact = fact[0].upper() + fact[1:]
 
             # No match anywhere - add to queue
-            queue.append({
+            queue.setdefault(fact, []).append({
                 "fact": fact,
                 "source_id": headline["source_id"],
                 "source_name": headline["source_name"],
@@ -5993,20 +6459,27 @@ def process_cycle():
             queued_count += 1
             log.info(f"Queued: {fact[:40]}...")
 
-    # Save queue
-    save_queue(queue)
+    # Save queue and this cycle's publications
+    queued_items = queue_items(queue)
+    save_queue(queued_items)
+    flush_daily_log()
+    flush_stories_json()
+    flush_rss_feed()
 
     # Calculate cycle duration and write monitor data
     cycle_duration = time.time() - cycle_start
     write_monitor_data({
-        "headlines_scraped": len(headlines),
+        "headlines_scraped": total_headlines,
         "headlines_processed": processed_count,
         "stories_published": published_count,
         "stories_queued": queued_count,
         "duration_seconds": round(cycle_duration, 1)
     })
 
-    log.info(f"Cycle complete. Published: {published_count}, Queue: {len(queue)}, Skipped (cached): {skipped_count}")
+    # Let this cycle's pushes and alerts finish before the next cycle starts
+    drain_background_io()
+
+    log.info(f"Cycle complete. Published: {published_count}, Queue: {len(queued_items)}, Skipped (cached): {skipped_count}")
 
 
 # =============================================================================
@@ -6073,7 +6546,7 @@ Return ONLY valid JSON, no explanation or markdown."""
 def research_source_ownership(source: dict) -> dict:
     """Use Claude to research current ownership for a source."""
     try:
-        client = anthropic.Anthropic()
+        client = get_claude_client()
 
         prompt = OWNERSHIP_RESEARCH_PROMPT.format(
             source_name=source.get("name", source.get("id")),
@@ -6244,16 +6717,21 @@ def apply_ownership_changes(changes: list):
 
 
 def check_midnight_archive():
-    """Check if it's time to archive and cleanup (midnight GMT = 00:00 UTC)."""
-    global _midnight_archive_done_for
+    """Archive and clean up once the UTC date has rolled over (midnight GMT).
+
+    Runs on the first check of each new UTC day, however long the cycle
+    before it took, and at most once per day.
+    """
+    global _last_archive_date
     now = datetime.now(timezone.utc)
-    today = now.date().isoformat()
+    today = now.date()
 
-    if now.hour == 0 and now.minute < 5:
-        # Idempotency guard: only run once per day
-        if _midnight_archive_done_for == today:
-            return  # Already done today
-        _midnight_archive_done_for = today
+    if _last_archive_date is None:
+        # Starting up: only treat today's archive as due right after midnight
+        _last_archive_date = today if (now.hour, now.minute) >= (0, 5) else today - timedelta(days=1)
+
+    if today > _last_archive_date:
+        _last_archive_date = today
 
         # Get yesterday's date for archiving
         yesterday = (now.date() - timedelta(days=1)).strftime("%Y-%m-%d")
@@ -6284,6 +6762,25 @@ def check_midnight_archive():
                 f.write(f"Log cleared at {now.isoformat()}\n")
 
 
+# Set from signal handlers: SIGTERM stops the loop once the current cycle is
+# done; SIGUSR1 ends the current sleep so a cycle (and its kill switch check)
+# runs now
+_stop_event = threading.Event()
+_wake_event = threading.Event()
+
+
+def handle_stop_signal(signum, frame):
+    """SIGTERM: finish the current cycle, then shut down."""
+    log.info(f"Received signal {signum}, stopping...")
+    _stop_event.set()
+    _wake_event.set()
+
+
+def handle_wake_signal(signum, frame):
+    """SIGUSR1: skip the rest of the current sleep."""
+    _wake_event.set()
+
+
 def main():
     """Main entry point."""
     global _offline_alert_sent
@@ -6332,7 +6829,11 @@ def main():
     if _degraded_services:
         log.info(f"Starting in degraded mode: {_degraded_services}")
 
-    while True:
+    signal.signal(signal.SIGTERM, handle_stop_signal)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, handle_wake_signal)
+
+    while not _stop_event.is_set():
         try:
             # Write heartbeat to indicate we're alive
             write_heartbeat()
@@ -6356,7 +6857,9 @@ def main():
             remaining = sleep_seconds
             while remaining > 0:
                 sleep_time = min(heartbeat_interval, remaining)
-                time.sleep(sleep_time)
+                if _wake_event.wait(sleep_time):
+                    _wake_event.clear()
+                    break  # Woken by a signal
                 remaining -= sleep_time
                 if remaining > 0:
                     # Update heartbeat and monitor during sleep
@@ -6364,13 +6867,16 @@ def main():
                     write_sleeping_heartbeat(int(remaining // 60))
 
         except KeyboardInterrupt:
-            log.info("Shutting down...")
             break
         except Exception as e:
             # Log errors but don't send SMS alerts for code bugs
             # Alerts are reserved for: stream offline, contradictions, major issues
             log.error(f"Cycle error: {e}")
-            time.sleep(60)  # Wait 1 minute on error
+            _stop_event.wait(60)  # Wait 1 minute on error
+
+    log.info("Shutting down...")
+    drain_background_io()
+    close_daily_log()
 
 
 # =============================================================================
@@ -6391,8 +6897,10 @@ def rebuild_stories_from_log():
     2. Hash-based lookup in archive folder
     3. Legacy index-based fallback
     """
+    flush_daily_log()
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     log_file = DATA_DIR / f"{today}.txt"
+    flush_stories_json()
     stories_file = DATA_DIR / "stories.json"
 
     if not log_file.exists():
@@ -6458,12 +6966,11 @@ def rebuild_stories_from_log():
                 name = name.strip()
                 source_id = None
                 source_url = urls[i].strip() if i < len(urls) else ""
-                for src in CONFIG["sources"]:
-                    if src["name"] == name:
-                        source_id = src["id"]
-                        if not source_url:
-                            source_url = src.get("url", "")
-                        break
+                src = SOURCES_BY_NAME.get(name)
+                if src:
+                    source_id = src["id"]
+                    if not source_url:
+                        source_url = src.get("url", "")
                 if source_id:
                     source_parts.append(f"{name} {get_compact_scores(source_id)}")
                 else:
@@ -6489,7 +6996,7 @@ def rebuild_stories_from_log():
 
             # 2. Try hash-based lookup
             if not audio_filename:
-                fact_hash = get_story_hash(fact)
+                fact_hash = get_story_audio_id(fact)
                 hash_filename = f"{fact_hash}.mp3"
                 if hash_filename in archived_audio:
                     audio_filename = hash_filename
@@ -6522,8 +7029,7 @@ def rebuild_stories_from_log():
 
     # Write rebuilt stories.json
     data = {"date": today, "stories": stories}
-    with open(stories_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json_file(stories_file, data)
 
     log.info(f"Rebuilt stories.json: {len(stories)} stories (from {log_file.name})")
     return True
@@ -6542,7 +7048,7 @@ def regenerate_audio_for_date(date: str, force: bool = False) -> dict:
     Returns:
         Dict with 'generated', 'skipped', 'failed' counts
     """
-    import gzip
+    flush_daily_log()
 
     log.info(f"=== Regenerating audio for {date} ===")
 
@@ -6559,7 +7065,7 @@ def regenerate_audio_for_date(date: str, force: bool = False) -> dict:
         year = date[:4]
         archive_file = BASE_DIR / "docs" / "archive" / year / f"{date}.txt.gz"
         if archive_file.exists():
-            with gzip.open(archive_file, 'rt', encoding='utf-8') as f:
+            with igzip.open(archive_file, 'rt', encoding='utf-8') as f:
                 lines = f.readlines()
             log.info(f"Loading from archive: {archive_file}")
         else:
@@ -6595,7 +7101,7 @@ def regenerate_audio_for_date(date: str, force: bool = False) -> dict:
             continue
 
         # Generate hash-based filename
-        fact_hash = get_story_hash(fact)
+        fact_hash = get_story_audio_id(fact)
         audio_filename = f"{fact_hash}.mp3"
         audio_path = archive_dir / audio_filename
 
@@ -6610,7 +7116,7 @@ def regenerate_audio_for_date(date: str, force: bool = False) -> dict:
         # (Don't use generate_tts() as it writes to TODAY's folder)
         log.info(f"  Story {story_index}: Generating audio for: {fact[:50]}...")
         try:
-            client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+            client = get_elevenlabs_client()
 
             audio_generator = client.text_to_speech.convert(
                 voice_id=os.getenv("ELEVENLABS_VOICE_ID"),
@@ -6659,10 +7165,8 @@ def get_source_url_by_name(name: str) -> str:
     # Remove "(+N more)" suffix if present
     if " (+" in name:
         name = name.split(" (+")[0]
-    for src in CONFIG["sources"]:
-        if src["name"] == name:
-            return src.get("url", "")
-    return ""
+    src = SOURCES_BY_NAME.get(name)
+    return src.get("url", "") if src else ""
 
 
 def rebuild_archives_with_urls():
@@ -6671,6 +7175,7 @@ def rebuild_archives_with_urls():
     Converts old format (timestamp|names|scores|fact) to
     new format (timestamp|names|scores|urls|fact).
     """
+    close_daily_log()
     import gzip
 
     docs_dir = BASE_DIR / "docs"
@@ -6685,7 +7190,7 @@ def rebuild_archives_with_urls():
         for gz_file in year_dir.glob("*.txt.gz"):
             try:
                 # Read and decompress
-                with gzip.open(gz_file, 'rt', encoding='utf-8') as f:
+                with igzip.open(gz_file, 'rt', encoding='utf-8') as f:
                     content = f.read()
 
                 # Process lines
@@ -6812,6 +7317,7 @@ def rebuild_feed_with_urls():
 
 def rebuild_stories_json_with_urls():
     """Rebuild stories.json to include source_urls for all stories."""
+    flush_stories_json()
     stories_file = DATA_DIR / "stories.json"
 
     if not stories_file.exists():
@@ -6850,8 +7356,7 @@ def rebuild_stories_json_with_urls():
                     stories_updated += 1
 
         # Write back
-        with open(stories_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json_file(stories_file, data)
 
         # Also copy to docs
         docs_dir = BASE_DIR / "docs"